@@ -6,8 +6,10 @@
 - Управление пользователями (регистрация, аутентификация, управление профилями)
 
 Структура пакета:
+    config_core - Загрузка переменных окружения и настройки приложения
     database_core - Настройка и подключение к базе данных
     models - SQLAlchemy модели для базы данных
+    password_core - Хеширование и проверка паролей
     repositories - Слой доступа к данным (репозитории)
     routers - API эндпоинты FastAPI
     schemas - Pydantic схемы для валидации и сериализации
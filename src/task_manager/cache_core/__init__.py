@@ -0,0 +1,32 @@
+"""
+Этот модуль предоставляет кэш ответов API в Redis.
+"""
+
+from .redis_cache import (
+    TASKS_CACHE_TTL,
+    cache_get,
+    cache_set,
+    close_cache,
+    get_cache,
+    get_redis,
+    invalidate_user_tasks,
+    user_task_key,
+    user_tasks_key,
+)
+
+__all__ = [
+    "TASKS_CACHE_TTL",
+    "cache_get",
+    "cache_set",
+    "close_cache",
+    "get_cache",
+    "get_redis",
+    "invalidate_user_tasks",
+    "user_task_key",
+    "user_tasks_key",
+]
+
+"""
+Список всех публичных объектов, экспортируемых из этого модуля.
+Используется для удобства импорта всех объектов сразу с помощью from . import all.
+"""
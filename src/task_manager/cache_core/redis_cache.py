@@ -0,0 +1,147 @@
+"""
+Кэш ответов API в Redis (read-through с коротким TTL и явной инвалидацией).
+"""
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.task_manager.config_core import settings
+from src.task_manager.logger_core import logger
+
+# Время жизни закэшированного ответа в секундах. Изменения через эндпоинты /service,
+# /service_user, /tasks и /users сбрасывают кэш сразу, TTL ограничивает устаревание
+# при изменениях в обход API.
+TASKS_CACHE_TTL = 60
+
+
+def user_tasks_key(user_id: int) -> str:
+    """
+    Формирует ключ кэша списка задач пользователя.
+
+    :param user_id: ID пользователя.
+    :return: str - Ключ вида user:{user_id}:tasks.
+    """
+    return f"user:{user_id}:tasks"
+
+
+def user_task_key(user_id: int, task_id: int) -> str:
+    """
+    Формирует ключ кэша отдельной задачи пользователя.
+
+    :param user_id: ID пользователя.
+    :param task_id: ID задачи.
+    :return: str - Ключ вида user:{user_id}:task:{task_id}.
+    """
+    return f"user:{user_id}:task:{task_id}"
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Redis | None:
+    """
+    Создаёт клиент Redis один раз на процесс.
+
+    Клиент держит собственный пул соединений; если REDIS_URL не задан, кэш отключён.
+
+    :return: Redis - Асинхронный клиент Redis или None, если кэш отключён.
+    """
+    if not settings.redis_url:
+        logger.info("REDIS_URL is not set, response cache is disabled.")
+
+        return None
+    logger.info("Response cache enabled (Redis).")
+
+    return Redis.from_url(settings.redis_url)
+
+
+async def get_cache() -> Redis | None:
+    """
+    Зависимость FastAPI, возвращающая клиент Redis.
+
+    :return: Redis - Асинхронный клиент Redis или None, если кэш отключён.
+    """
+    return get_redis()
+
+
+async def close_cache() -> None:
+    """
+    Закрывает пул соединений клиента Redis при остановке приложения.
+
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    client = get_redis()
+    if client is not None:
+        await client.aclose()
+        logger.info("Redis client closed.")
+
+
+async def cache_get(cache: Redis | None, key: str) -> bytes | None:
+    """
+    Читает значение из кэша.
+
+    Ошибка Redis не должна ломать запрос: она логируется и считается промахом кэша.
+
+    :param cache: Клиент Redis или None, если кэш отключён.
+    :param key: Ключ кэша.
+    :return: bytes - Закэшированное значение или None при промахе.
+    """
+    if cache is None:
+        return None
+    try:
+        return await cache.get(key)
+    except RedisError as error:
+        logger.warning("Cache read failed for %s: %s", key, error)
+
+        return None
+
+
+async def cache_set(cache: Redis | None, key: str, value: bytes) -> None:
+    """
+    Записывает значение в кэш на TASKS_CACHE_TTL секунд.
+
+    :param cache: Клиент Redis или None, если кэш отключён.
+    :param key: Ключ кэша.
+    :param value: Сериализованное значение.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    if cache is None:
+        return
+    try:
+        await cache.set(key, value, ex=TASKS_CACHE_TTL)
+    except RedisError as error:
+        logger.warning("Cache write failed for %s: %s", key, error)
+
+
+async def invalidate_user_tasks(
+    cache: Redis | None,
+    user_id: int,
+    task_id: int | None = None,
+    all_tasks: bool = False,
+) -> None:
+    """
+    Сбрасывает кэш задач пользователя после изменения данных.
+
+    Список задач сбрасывается всегда; отдельная задача — если передан её ID.
+    С all_tasks=True сбрасываются все закэшированные задачи пользователя
+    (например, при удалении учётной записи).
+
+    :param cache: Клиент Redis или None, если кэш отключён.
+    :param user_id: ID пользователя.
+    :param task_id: ID изменённой задачи.
+    :param all_tasks: Сбросить все закэшированные задачи пользователя.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    if cache is None:
+        return
+    keys = [user_tasks_key(user_id)]
+    if task_id is not None:
+        keys.append(user_task_key(user_id, task_id))
+    try:
+        if all_tasks:
+            keys.extend(
+                [key async for key in cache.scan_iter(match=f"user:{user_id}:task:*")]
+            )
+        await cache.delete(*keys)
+    except RedisError as error:
+        logger.warning("Cache invalidation failed for user %s: %s", user_id, error)
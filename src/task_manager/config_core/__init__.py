@@ -0,0 +1,13 @@
+"""
+Этот модуль предоставляет доступ к переменным окружения приложения.
+"""
+
+from .env_config import get_env
+from .settings import Settings, settings
+
+__all__ = ["Settings", "get_env", "settings"]
+
+"""
+Список всех публичных объектов, экспортируемых из этого модуля.
+Используется для удобства импорта всех объектов сразу с помощью from . import all.
+"""
@@ -0,0 +1,28 @@
+"""
+Загрузка переменных окружения из файла .env (однократно на процесс).
+"""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+ENV_LOADED_FLAG = "_ENV_LOADED"
+
+
+@lru_cache(maxsize=1)
+def get_env() -> dict[str, str]:
+    """
+    Возвращает снимок переменных окружения с учётом файла .env.
+
+    Файл .env разбирается только при первом вызове; последующие вызовы возвращают
+    закэшированный словарь. Если флаг _ENV_LOADED уже выставлен (например, родительским
+    процессом pytest), разбор файла пропускается полностью.
+
+    :return: Словарь переменных окружения.
+    """
+    if not os.environ.get(ENV_LOADED_FLAG):
+        load_dotenv()
+        os.environ[ENV_LOADED_FLAG] = "1"
+
+    return dict(os.environ)
@@ -0,0 +1,63 @@
+"""
+Настройки приложения, прочитанные из окружения один раз при импорте.
+"""
+
+from dataclasses import dataclass
+
+from .env_config import get_env
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Неизменяемый набор настроек приложения.
+
+    Атрибуты:
+    - pg_user, pg_password, pg_host, pg_name: параметры подключения к PostgreSQL
+      (None, если переменная не задана).
+    - secret_key: ключ подписи JWT.
+    - algorithm: алгоритм подписи JWT.
+    - access_token_expire_minutes: время жизни access-токена в минутах.
+    - auto_create_db: создавать ли таблицы при старте приложения.
+    - db_pool_size, db_max_overflow: размер пула соединений PostgreSQL и число
+      дополнительных соединений сверх него (на один процесс).
+    - redis_url: адрес Redis для кэша ответов (None — кэш отключён).
+    """
+
+    pg_user: str | None
+    pg_password: str | None
+    pg_host: str | None
+    pg_name: str | None
+    secret_key: str
+    algorithm: str
+    access_token_expire_minutes: int
+    auto_create_db: bool
+    db_pool_size: int
+    db_max_overflow: int
+    redis_url: str | None
+
+
+def load_settings() -> Settings:
+    """
+    Собирает Settings из переменных окружения (с учётом файла .env).
+
+    :return: Settings - Заполненный объект настроек.
+    """
+    env = get_env()
+
+    return Settings(
+        pg_user=env.get("POSTGRES_USER"),
+        pg_password=env.get("POSTGRES_PASSWORD"),
+        pg_host=env.get("POSTGRES_HOST"),
+        pg_name=env.get("POSTGRES_NAME"),
+        secret_key=env.get("SECRET_KEY", "my_secret"),
+        algorithm=env.get("ALGORITHM", "HS256"),
+        access_token_expire_minutes=int(env.get("ACCESS_TOKEN_EXPIRE_MINUTES", "10")),
+        auto_create_db=env.get("APP_AUTO_CREATE_DB") == "1",
+        db_pool_size=int(env.get("DB_POOL_SIZE", "20")),
+        db_max_overflow=int(env.get("DB_MAX_OVERFLOW", "40")),
+        redis_url=env.get("REDIS_URL"),
+    )
+
+
+settings = load_settings()
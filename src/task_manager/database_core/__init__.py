@@ -2,9 +2,29 @@
 Этот модуль предоставляет доступ к компонентам базы данных.
 """
 
-from .database import Base, async_engine, async_session_local, get_db
+from .database import (
+    STREAM_BATCH_SIZE,
+    Base,
+    async_engine,
+    async_session_local,
+    enable_sqlite_foreign_keys,
+    get_db,
+    get_engine,
+    get_db_tx,
+    warm_up_pool,
+)
 
-__all__ = ["Base", "async_engine", "async_session_local", "get_db"]
+__all__ = [
+    "STREAM_BATCH_SIZE",
+    "Base",
+    "async_engine",
+    "async_session_local",
+    "enable_sqlite_foreign_keys",
+    "get_db",
+    "get_db_tx",
+    "get_engine",
+    "warm_up_pool",
+]
 
 """
 Список всех публичных объектов, экспортируемых из этого модуля.
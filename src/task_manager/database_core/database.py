@@ -2,35 +2,51 @@
 Модуль настроек подключения к базе данных (SQLAlchemy, асинхронный режим).
 """
 
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import event
+from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
 )
+import asyncio
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
-from src.task_manager.logger_core import logger
+import orjson
 
-load_dotenv()
+from src.task_manager.config_core import settings
+from src.task_manager.logger_core import logger
 
 
-class Base(DeclarativeBase):
+class Base(MappedAsDataclass, DeclarativeBase):
     """
     Базовый класс для всех моделей SQLAlchemy.
     Используется для объявления таблиц базы данных.
+
+    MappedAsDataclass превращает модели в dataclass: конструктор и repr генерируются
+    по аннотациям Mapped[...] при объявлении класса.
     """
 
     pass
 
 
-db_user = os.environ.get("POSTGRES_USER")
-db_password = os.environ.get("POSTGRES_PASSWORD")
-db_host = os.environ.get("POSTGRES_HOST")
-db_name = os.environ.get("POSTGRES_NAME")
+db_user = settings.pg_user
+db_password = settings.pg_password
+db_host = settings.pg_host
+db_name = settings.pg_name
 
-DATABASE_URL = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}/{db_name}"
+# Размер пула настраивается под нагрузку переменными DB_POOL_SIZE и DB_MAX_OVERFLOW.
+POOL_SIZE = settings.db_pool_size
+MAX_OVERFLOW = settings.db_max_overflow
+POOL_RECYCLE = 1800
+POOL_WARM_UP_SIZE = 10
+QUERY_CACHE_SIZE = 2000
+STATEMENT_CACHE_SIZE = 1024
+# Размер пачки строк при потоковом чтении больших выборок (yield_per).
+STREAM_BATCH_SIZE = 500
 
 if not all([db_user, db_password, db_host, db_name]):
     logger.warning("PostgreSQL environment variables are missing!")
@@ -39,36 +55,152 @@ if not all([db_user, db_password, db_host, db_name]):
     my_app_dir = os.path.dirname(current_file_path)
     db_path = os.path.join(my_app_dir, "db_for_tasks_and_users")
     DATABASE_URL = f"sqlite+aiosqlite:///{db_path}"
-    logger.info(f"Fallback: Using SQLite database at {db_path}")
+    logger.info("Fallback: Using SQLite database at %s", db_path)
+
+    # aiosqlite открывает файл локально — пул соединений не даёт выигрыша.
+    engine_options = {"poolclass": NullPool}
 else:
     DATABASE_URL = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}/{db_name}"
-    logger.info(f"Connecting to PostgreSQL at {db_host} (DB: {db_name})")
+    logger.info("Connecting to PostgreSQL at %s (DB: %s)", db_host, db_name)
+
+    # Пул задаётся явно: синхронный QueuePool при асинхронном драйвере приводит к зависаниям.
+    engine_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_use_lifo": True,
+        # JIT PostgreSQL замедляет короткие OLTP-запросы репозиториев и установку соединения.
+        # Кэши подготовленных выражений (asyncpg и адаптера SQLAlchemy) расширены, чтобы
+        # горячие запросы не подготавливались заново на каждом соединении.
+        "connect_args": {
+            "server_settings": {"jit": "off"},
+            "statement_cache_size": STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
+def orjson_dumps(value: object) -> str:
+    """
+    Сериализует значение JSON-колонки через orjson.
 
-try:
-    async_engine = create_async_engine(DATABASE_URL)
-    logger.info("Database engine successfully initialized")
-except Exception as e:
-    logger.critical(f"Failed to initialize database engine: {e}")
-    raise
+    Драйверы ожидают строку, поэтому байты orjson декодируются.
+
+    :param value: Значение для сериализации.
+    :return: str - JSON-строка.
+    """
+    return orjson.dumps(value).decode()
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Включает проверку внешних ключей (PRAGMA foreign_keys=ON) для каждого соединения SQLite.
+
+    SQLite по умолчанию не проверяет FOREIGN KEY, а репозитории полагаются на то,
+    что база данных отклонит ссылку на несуществующую запись.
+
+    :param engine: Асинхронный движок SQLite.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_foreign_keys(dbapi_connection: object, connection_record: object) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """
+    Возвращает единственный на процесс асинхронный движок SQLAlchemy.
+
+    Движок и его пул соединений создаются при первом вызове; повторные вызовы
+    (в том числе из тестов) получают тот же объект и не открывают новый пул.
+
+    :return: AsyncEngine - Асинхронный движок базы данных.
+    """
+    try:
+        # Кэш скомпилированных выражений увеличен относительно 500 по умолчанию,
+        # чтобы разные варианты запросов репозиториев не вытесняли друг друга.
+        engine = create_async_engine(
+            DATABASE_URL,
+            query_cache_size=QUERY_CACHE_SIZE,
+            json_serializer=orjson_dumps,
+            json_deserializer=orjson.loads,
+            **engine_options,
+        )
+        if engine.dialect.name == "sqlite":
+            enable_sqlite_foreign_keys(engine)
+        logger.info("Database engine successfully initialized")
+    except Exception as e:
+        logger.critical("Failed to initialize database engine: %s", e)
+        raise
+
+    return engine
+
+
+async_engine = get_engine()
 
 async_session_local = async_sessionmaker(
     bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
 )
 
 
+async def warm_up_pool(size: int = POOL_WARM_UP_SIZE) -> None:
+    """
+    Заранее открывает соединения пула, чтобы первые запросы не тратили время на подключение.
+
+    Соединения устанавливаются параллельно и сразу возвращаются в пул. Для SQLite (NullPool)
+    прогрев не выполняется — соединения там не переиспользуются.
+
+    Количество ограничено постоянным размером пула (DB_POOL_SIZE): сверх него пришлось бы
+    открывать overflow-соединения, которые закрываются сразу после возврата, а при
+    DB_MAX_OVERFLOW меньше недостающего числа прогрев ждал бы pool_timeout и прерывал запуск.
+
+    :param size: Количество соединений для прогрева.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    if isinstance(async_engine.pool, NullPool):
+        return
+
+    size = min(size, async_engine.pool.size())
+    connections = [async_engine.connect() for _ in range(size)]
+    try:
+        await asyncio.gather(*(connection.start() for connection in connections))
+    finally:
+        await asyncio.gather(*(connection.close() for connection in connections))
+    logger.info("Database pool warmed up with %s connections", size)
+
+
 async def get_db() -> AsyncSession:
     """
-    Функция для получения асинхронной сессии базы данных.
+    Функция для получения асинхронной сессии базы данных (без явной транзакции).
+
+    Сессия не открывает транзакцию заранее: для чтения это экономит лишние BEGIN/COMMIT,
+    а транзакция начинается автоматически при первом запросе. Репозитории, изменяющие данные,
+    фиксируют изменения явным вызовом commit(). После выхода из блока async with сессия
+    закрывается, а незафиксированные изменения откатываются.
+
+    Yields:
+        AsyncSession: Асинхронная сессия базы данных.
+    """
+    async with async_session_local() as session:
+        yield session
+
+
+async def get_db_tx() -> AsyncSession:
+    """
+    Функция для получения асинхронной сессии базы данных с открытой транзакцией.
 
-    Эта функция создает асинхронную сессию, начинает транзакцию и предоставляет ее
-    в качестве генератора.  Это позволяет использовать сессию в блоке async with.
-    После выхода из блока async with, сессия автоматически закрывается и транзакция откатывается,
-    если не было явно закоммичено.
+    Используется эндпоинтами, изменяющими данные. Транзакция фиксируется при успешном
+    выходе из блока async with и откатывается при исключении.
 
     Yields:
         AsyncSession: Асинхронная сессия базы данных.
     """
-    logger.debug("Creating new database session...")
     async with async_session_local() as session:
         async with session.begin():
             yield session
@@ -2,8 +2,12 @@
 Этот модуль представляет собой полную настройку логгеров для всего приложения
 """
 
-from .logging_config import logger
+from .logging_config import logger, start_log_listener, stop_log_listener
+from .request_logging import RequestLoggingMiddleware
 
 __all__ = [
+    "RequestLoggingMiddleware",
     "logger",
+    "start_log_listener",
+    "stop_log_listener",
 ]
@@ -2,18 +2,20 @@
 Конфигурация логирования проекта. Этот модуль настраивает систему логирования.
 """
 
+import atexit
 import logging
-from pathlib import Path
+import logging.handlers
+import os
+import queue
 
 from colorlog import ColoredFormatter
 
-current_file = Path(__file__).resolve()
-src_dir = current_file.parent.parent
-log_dir = src_dir / "logs"
+src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+log_dir = os.path.join(src_dir, "logs")
 
-log_dir.mkdir(parents=True, exist_ok=True)
+os.makedirs(log_dir, exist_ok=True)
 
-log_file_path = log_dir / "app.log"
+log_file_path = os.path.join(log_dir, "app.log")
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -35,10 +37,48 @@ file_formatter = logging.Formatter(
 )
 
 console_handler = logging.StreamHandler()
-file_handler = logging.FileHandler(filename=str(log_file_path), encoding="utf-8")
+# delay=True: файл открывается при первой записи в лог, не при импорте модуля.
+file_handler = logging.FileHandler(filename=log_file_path, encoding="utf-8", delay=True)
 
 console_handler.setFormatter(console_formatter)
 file_handler.setFormatter(file_formatter)
 
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Запись в консоль и файл выполняется в фоновом потоке QueueListener: в потоке event loop
+# остаётся только постановка записи в очередь, без блокирующего write().
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+queue_handler = logging.handlers.QueueHandler(log_queue)
+log_listener = logging.handlers.QueueListener(
+    log_queue, console_handler, file_handler, respect_handler_level=True
+)
+
+logger.addHandler(queue_handler)
+
+_listener_running = False
+
+
+def start_log_listener() -> None:
+    """
+    Запускает фоновый поток записи логов (повторный вызов ничего не делает).
+
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    global _listener_running
+    if not _listener_running:
+        log_listener.start()
+        _listener_running = True
+
+
+def stop_log_listener() -> None:
+    """
+    Останавливает фоновый поток записи логов, предварительно записав накопленные записи.
+
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    global _listener_running
+    if _listener_running:
+        log_listener.stop()
+        _listener_running = False
+
+
+start_log_listener()
+atexit.register(stop_log_listener)
@@ -0,0 +1,83 @@
+"""
+ASGI-middleware для логирования запросов: одна строка на запрос с длительностью обработки.
+"""
+
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .logging_config import logger
+
+# Идентификатор запроса принимается от клиента (или прокси) в этом заголовке
+# и возвращается в ответе: по нему строка лога сопоставляется запросу.
+REQUEST_ID_HEADER = b"x-request-id"
+
+
+class RequestLoggingMiddleware:
+    """
+    Middleware, записывающее в лог идентификатор запроса, метод, путь, статус ответа
+    и время обработки запроса.
+
+    Это единственная запись уровня INFO на запрос: роутеры и репозитории пишут
+    промежуточные шаги только на уровне DEBUG.
+
+    Реализовано как «чистое» ASGI-приложение (без BaseHTTPMiddleware), поэтому не создаёт
+    дополнительных задач и потоков на каждый запрос.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        :param app: Оборачиваемое ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обрабатывает ASGI-вызов и логирует результат HTTP-запроса.
+
+        :param scope: ASGI scope запроса.
+        :param receive: ASGI-канал получения сообщений.
+        :param send: ASGI-канал отправки сообщений.
+        :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        request_id = (
+            next(
+                (
+                    value
+                    for name, value in scope["headers"]
+                    if name == REQUEST_ID_HEADER
+                ),
+                None,
+            )
+            or uuid.uuid4().hex.encode()
+        )
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (REQUEST_ID_HEADER, request_id),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                "[%s] %s %s -> %s (%.1f ms)",
+                request_id.decode("latin-1"),
+                scope["method"],
+                scope["path"],
+                status_code,
+                duration_ms,
+            )
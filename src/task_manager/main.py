@@ -3,13 +3,19 @@
 инициализация базы данных при старте.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from src.task_manager.cache_core import close_cache
+from src.task_manager.config_core import settings
 from src.task_manager.database_core.database import (
     Base,
     async_engine,
+    warm_up_pool,
 )
 from src.task_manager.routers import (
     router_for_users,
@@ -17,7 +23,27 @@ from src.task_manager.routers import (
     user_router_for_service,
     task_router_for_service,
 )
-from src.task_manager.logger_core import logger
+from src.task_manager.logger_core import (
+    RequestLoggingMiddleware,
+    logger,
+    start_log_listener,
+    stop_log_listener,
+)
+
+
+async def create_tables() -> None:
+    """
+    Создаёт все таблицы, описанные в Base.metadata (эквивалент CREATE TABLE IF NOT EXISTS).
+
+    Для SQLite дополнительно включает журнал WAL (PRAGMA journal_mode=WAL).
+
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    async with async_engine.begin() as conn:
+        if async_engine.dialect.name == "sqlite":
+            await conn.execute(text("PRAGMA journal_mode=WAL"))
+        await conn.run_sync(Base.metadata.create_all)
+    logger.info("Database tables created successfully.")
 
 
 @asynccontextmanager
@@ -26,36 +52,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         Контекстный менеджер жизненного цикла приложения FastAPI, выполняющий инициализацию базы данных при старте приложения.
 
     Что делает
-    - При старте приложения открывает асинхронную транзакцию через async_engine и:
-      - создаёт все таблицы, описанные в Base.metadata (эквивалент CREATE TABLE IF NOT EXISTS),
+    - При старте приложения, если APP_AUTO_CREATE_DB=1, открывает асинхронную транзакцию через
+      async_engine и:
+      - для SQLite включает журнал WAL (PRAGMA journal_mode=WAL),
+      - создаёт все таблицы, описанные в Base.metadata (эквивалент CREATE TABLE IF NOT EXISTS).
+      В production схема создаётся миграциями, и этот шаг пропускается, чтобы каждый воркер
+      не выполнял лишние запросы к каталогу БД при старте.
+    - Прогревает пул соединений, чтобы первые запросы не платили за установку соединения.
+      Создание таблиц и прогрев пула независимы и выполняются параллельно в asyncio.TaskGroup.
     - Передаёт управление приложению (yield) — в этот момент приложение принимает и обрабатывает запросы.
-    - Не выполняет явной очистки/закрытия движка — при необходимости закрытие/уборку нужно сделать отдельно.
+    - При остановке закрывает все соединения пула (async_engine.dispose()), клиент Redis
+      и останавливает фоновый поток записи логов.
 
         :param app: Экземпляр класса FastAPI.
         :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
+    start_log_listener()
     logger.info("Starting application lifespan...")
 
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created successfully.")
+    async with asyncio.TaskGroup() as tg:
+        if settings.auto_create_db:
+            tg.create_task(create_tables())
+        else:
+            logger.info("APP_AUTO_CREATE_DB is not set, skipping table creation.")
+        tg.create_task(warm_up_pool())
     yield
 
+    await async_engine.dispose()
+    logger.info("Database engine disposed.")
+    await close_cache()
+    stop_log_listener()
 
-app = FastAPI(lifespan=lifespan)
-
-logger.info("Initializing FastAPI application...")
-
-app.include_router(router_for_users)
-logger.info("Included router: router_for_users")
-
-app.include_router(router_for_tasks)
-logger.info("Included router: router_for_tasks")
 
-app.include_router(user_router_for_service)
-logger.info("Included router: user_router_for_service")
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(RequestLoggingMiddleware)
 
-app.include_router(task_router_for_service)
-logger.info("Included router: task_router_for_service")
+routers = {
+    "router_for_users": router_for_users,
+    "router_for_tasks": router_for_tasks,
+    "user_router_for_service": user_router_for_service,
+    "task_router_for_service": task_router_for_service,
+}
+for router in routers.values():
+    app.include_router(router)
 
-logger.info("FastAPI application initialized successfully.")
+logger.info("FastAPI application initialized. Included routers: %s", ", ".join(routers))
@@ -3,10 +3,15 @@
 
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.task_manager.database_core.database import Base
 
+if TYPE_CHECKING:
+    from .user_models import UserModel
+
 
 class TaskModel(Base):
     """
@@ -20,14 +25,25 @@ class TaskModel(Base):
     - user: целочисленное поле, содержащее внешний ключ на таблицу users (users.id).
     - author: ORM-отношение (relationship) к модели UserModel; связывает задачу с её автором.
       Свойство back_populates должно соответствовать атрибуту в UserModel, который содержит
-      список задач (например, tasks).
+      список задач (например, tasks). Ленивая загрузка запрещена (lazy="raise"): запрос,
+      которому нужен автор, должен явно подгрузить его через selectinload(TaskModel.author).
+
+    Индексы:
+    - ix_tasks_user_id: (user, id) — поиск задачи пользователя по ID.
+    - ix_tasks_user_title: (user, title) — поиск задачи пользователя по названию.
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_user_id", "user", "id"),
+        Index("ix_tasks_user_title", "user", "title"),
+    )
 
-    id = Column(Integer, primary_key=True)
-    title = Column(String)
-    body = Column(String)
-    status = Column(String)
-    user = Column(Integer, ForeignKey("users.id"))
-    author = relationship("UserModel", back_populates="tasks")
+    id: Mapped[int] = mapped_column(primary_key=True, init=False)
+    title: Mapped[str | None] = mapped_column(String)
+    body: Mapped[str | None] = mapped_column(String)
+    status: Mapped[str | None] = mapped_column(String)
+    user: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
+    author: Mapped["UserModel"] = relationship(
+        back_populates="tasks", lazy="raise", init=False, repr=False
+    )
@@ -2,10 +2,15 @@
 Модуль модели пользователя (UserModel) для SQLAlchemy.
 """
 
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.task_manager.database_core.database import Base
 
+if TYPE_CHECKING:
+    from .task_models import TaskModel
+
 
 class UserModel(Base):
     """
@@ -15,15 +20,18 @@ class UserModel(Base):
     - id: первичный ключ (целое число).
     - name: имя пользователя.
     - email: адрес электронной почты.
-    - password: пароль.
+    - password: хеш пароля (формат см. password_core.hash_password).
     - tasks: ORM-отношение к задачам пользователя (список TaskModel), двунаправленное
-      через backpopulates="author" в TaskModel.
+      через backpopulates="author" в TaskModel. Ленивая загрузка запрещена (lazy="raise"),
+      чтобы случайный N+1 падал с ошибкой; при необходимости используйте selectinload.
     """
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String, unique=True)
-    email = Column(String, unique=True)
-    password = Column(String)
-    tasks = relationship("TaskModel", back_populates="author")
+    id: Mapped[int] = mapped_column(primary_key=True, init=False)
+    name: Mapped[str | None] = mapped_column(String, unique=True)
+    email: Mapped[str | None] = mapped_column(String, unique=True)
+    password: Mapped[str | None] = mapped_column(String)
+    tasks: Mapped[list["TaskModel"]] = relationship(
+        back_populates="author", lazy="raise", init=False, repr=False
+    )
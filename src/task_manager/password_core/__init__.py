@@ -0,0 +1,12 @@
+"""
+Этот модуль предоставляет функции хеширования и проверки паролей.
+"""
+
+from .password_hashing import hash_password, is_password_hash, verify_password
+
+__all__ = ["hash_password", "is_password_hash", "verify_password"]
+
+"""
+Список всех публичных объектов, экспортируемых из этого модуля.
+Используется для удобства импорта всех объектов сразу с помощью from . import all.
+"""
@@ -0,0 +1,90 @@
+"""
+Хеширование паролей на основе scrypt из стандартной библиотеки.
+"""
+
+import hashlib
+import hmac
+import os
+
+ALGORITHM = "scrypt"
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_SIZE = 16
+HASH_SIZE = 32
+
+
+def hash_password(password: str) -> str:
+    """
+    Хеширует пароль со случайной солью.
+
+    Результат хранится в формате "scrypt$n$r$p$соль$хеш", поэтому параметры
+    алгоритма можно менять без потери совместимости с уже сохранёнными паролями.
+
+    :param password: Пароль в открытом виде.
+    :return: Строка с параметрами, солью и хешем пароля.
+    """
+    salt = os.urandom(SALT_SIZE)
+    password_hash = hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=SCRYPT_N,
+        r=SCRYPT_R,
+        p=SCRYPT_P,
+        dklen=HASH_SIZE,
+    )
+
+    return f"{ALGORITHM}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${password_hash.hex()}"
+
+
+def is_password_hash(stored_hash: str | None) -> bool:
+    """
+    Проверяет, что значение из базы данных является хешем в формате hash_password.
+
+    Учётные записи, созданные до перехода на хеширование, хранят пароль в открытом виде;
+    для них функция возвращает False.
+
+    :param stored_hash: Значение поля password из базы данных.
+    :return: True, если значение имеет формат "scrypt$n$r$p$соль$хеш", иначе False.
+    """
+    if stored_hash is None:
+        return False
+    parts = stored_hash.split("$")
+
+    return len(parts) == 6 and parts[0] == ALGORITHM
+
+
+def verify_password(password: str, stored_hash: str | None) -> bool:
+    """
+    Проверяет пароль против сохранённого хеша.
+
+    Сравнение выполняется за постоянное время через hmac.compare_digest. Если в базе
+    данных хранится пароль в открытом виде (учётная запись создана до перехода на
+    хеширование), пароль сравнивается с ним напрямую; такой пароль следует
+    перехешировать после успешного входа (см. is_password_hash).
+
+    :param password: Пароль в открытом виде.
+    :param stored_hash: Хеш из базы данных в формате hash_password.
+    :return: True, если пароль совпадает, иначе False.
+    """
+    if stored_hash is None:
+        return False
+    if not is_password_hash(stored_hash):
+        return hmac.compare_digest(password.encode(), stored_hash.encode())
+    _, n, r, p, salt, password_hash = stored_hash.split("$")
+    try:
+        expected = bytes.fromhex(password_hash)
+        salt_bytes = bytes.fromhex(salt)
+        n, r, p = int(n), int(r), int(p)
+    except ValueError:
+        return False
+    candidate = hashlib.scrypt(
+        password.encode(),
+        salt=salt_bytes,
+        n=n,
+        r=r,
+        p=p,
+        dklen=len(expected),
+    )
+
+    return hmac.compare_digest(candidate, expected)
@@ -2,13 +2,112 @@
 Репозиторий сервисных операций над моделями (асинхронный слой доступа к данным).
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache, partial
+
 from fastapi import HTTPException
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, and_, bindparam, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+from sqlalchemy.sql import Update
+from src.task_manager.database_core import STREAM_BATCH_SIZE
 from src.task_manager.models import UserModel, TaskModel
+from src.task_manager.password_core import (
+    hash_password,
+    is_password_hash,
+    verify_password,
+)
 from src.task_manager.schemas import TaskUpdate
 from src.task_manager.logger_core import logger
 
+# Пулы, которые выдают всем сессиям одно и то же соединение (например, SQLite в памяти).
+SINGLE_CONNECTION_POOLS = (StaticPool, SingletonThreadPool)
+
+# Запросы собираются один раз при импорте: одинаковый объект Select при каждом вызове
+# гарантирует попадание в кэш скомпилированных выражений SQLAlchemy.
+# USER_BY_NAME и TASKS_BY_USER выбирают только колонки и выполняются на уровне Core
+# (без ORM): строки не превращаются в объекты моделей и не попадают в identity map.
+# Пароль не сравнивается в SQL: строка ищется по уникальному имени, хеш проверяется в Python.
+USER_BY_NAME = select(UserModel.id, UserModel.name, UserModel.password).where(
+    UserModel.name == bindparam("username")
+)
+REHASH_USER_PASSWORD = (
+    update(UserModel)
+    .where(UserModel.id == bindparam("user_id"))
+    .values(password=bindparam("password_hash"))
+)
+TASKS_BY_USER = select(
+    TaskModel.id,
+    TaskModel.title,
+    TaskModel.body,
+    TaskModel.status,
+    TaskModel.user,
+).where(TaskModel.user == bindparam("user_id"))
+STREAM_TASKS_BY_USER = TASKS_BY_USER.execution_options(yield_per=STREAM_BATCH_SIZE)
+# Задачи пользователя одним запросом: LEFT JOIN возвращает минимум одну строку для
+# существующего пользователя, даже если задач нет (тогда поля задачи равны NULL).
+USER_WITH_TASKS = (
+    select(
+        TaskModel.id,
+        TaskModel.title,
+        TaskModel.body,
+        TaskModel.status,
+        TaskModel.user,
+    )
+    .select_from(UserModel)
+    .outerjoin(TaskModel, TaskModel.user == UserModel.id)
+    .where(UserModel.id == bindparam("user_id"))
+)
+# Общее условие "задача пользователя по ID или названию": неиспользуемый параметр
+# передаётся как None; условие "= NULL" ложно, поэтому один запрос подходит для поиска
+# по ID и по названию.
+TASK_OF_USER = and_(
+    TaskModel.user == bindparam("user_id"),
+    or_(
+        TaskModel.id == bindparam("task_id"),
+        TaskModel.title == bindparam("task_title"),
+    ),
+)
+# Названия задач не уникальны, поэтому чтение, изменение и удаление по названию
+# затрагивают только одну задачу: подходящую задачу пользователя под наименьшим ID.
+ONE_TASK_OF_USER = (
+    TaskModel.id
+    == select(TaskModel.id)
+    .where(TASK_OF_USER)
+    .order_by(TaskModel.id)
+    .limit(1)
+    .scalar_subquery()
+)
+TASK_BY_ID_OR_TITLE = select(TaskModel).where(ONE_TASK_OF_USER)
+DELETE_TASK_OF_USER = (
+    delete(TaskModel)
+    .where(ONE_TASK_OF_USER)
+    .returning(TaskModel.id, TaskModel.title)
+    .execution_options(synchronize_session=False)
+)
+
+
+@lru_cache(maxsize=16)
+def update_task_of_user(fields: frozenset[str]) -> Update:
+    """
+    Возвращает UPDATE ... RETURNING для одной задачи пользователя (условие
+    ONE_TASK_OF_USER) с заданным набором изменяемых полей.
+
+    Новые значения передаются параметрами new_<поле>, поэтому для каждого набора полей
+    выражение строится и компилируется один раз.
+
+    :param fields: Имена изменяемых полей задачи.
+    :return: Update - Выражение UPDATE с параметрами TASK_OF_USER и new_<поле>.
+    """
+    return (
+        update(TaskModel)
+        .where(ONE_TASK_OF_USER)
+        .values({field: bindparam(f"new_{field}") for field in sorted(fields)})
+        .returning(TaskModel)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
 
 class ServiceRepository:
     """
@@ -24,30 +123,39 @@ class ServiceRepository:
         username: str,
         password: str,
         session: AsyncSession,
-    ) -> UserModel | None:
+    ) -> Row | None:
         """
         Аутентифицирует пользователя по имени пользователя и паролю.
 
         :param username: Имя пользователя.
         :param password: Пароль пользователя.
         :param session: Асинхронная сессия.
-        :return: UserModel - Объект пользователя,
+        :return: Row - Строка с полями id, name и password (хеш) пользователя,
         если аутентификация прошла успешно, иначе None.
         """
-        logger.info(f"User login attempt: {username}")
+        logger.debug("User login attempt: %s", username)
 
-        stmt = (
-            select(UserModel)
-            .where(UserModel.name == username)
-            .where(UserModel.password == password)
-        )
-        result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
-        if user is None:
-            logger.warning(f"Failed login for: {username}")
+        connection = await session.connection()
+        result = await connection.execute(USER_BY_NAME, {"username": username})
+        user = result.one_or_none()
+        # scrypt нагружает CPU, поэтому проверка выполняется в пуле потоков, не блокируя event loop.
+        if user is None or not await asyncio.to_thread(
+            verify_password, password, user.password
+        ):
+            logger.warning("Failed login for: %s", username)
 
             raise HTTPException(status_code=404, detail="User not found")
-        logger.info(f"Login successful: {username}")
+        if not is_password_hash(user.password):
+            # Учётная запись создана до перехода на хеширование: открытый пароль
+            # заменяется хешем при первом успешном входе.
+            password_hash = await asyncio.to_thread(hash_password, password)
+            await connection.execute(
+                REHASH_USER_PASSWORD,
+                {"user_id": user.id, "password_hash": password_hash},
+            )
+            await session.commit()
+            logger.info("Legacy password of user %s rehashed", username)
+        logger.debug("Login successful: %s", username)
 
         return user
 
@@ -56,23 +164,107 @@ class ServiceRepository:
         cls,
         user_id: str,
         session: AsyncSession,
-    ) -> list[TaskModel] | list[None]:
+    ) -> list[Row] | list[None]:
         """
         Получает список задач, назначенных указанному пользователю.
 
         :param user_id: ID пользователя.
         :param session: Асинхронная сессия.
-        :return: List[TaskModel] - Список объектов задач, назначенных пользователю.
+        :return: List[Row] - Список строк задач (id, title, body, status, user),
+        назначенных пользователю.
+        """
+        logger.debug("Fetching tasks for user_id: %s", user_id)
+
+        connection = await session.connection()
+        result = await connection.execute(TASKS_BY_USER, {"user_id": user_id})
+        tasks: list[Row] | list = result.all()
+
+        logger.debug("Found %s tasks for user_id: %s", len(tasks), user_id)
+        return tasks
+
+    @classmethod
+    async def stream_tasks_by_user(
+        cls,
+        user_id: int,
+        session: AsyncSession,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Отдаёт задачи пользователя пачками по STREAM_BATCH_SIZE строк.
+
+        Строки читаются через серверный курсор (yield_per), поэтому в памяти одновременно
+        находится не больше одной пачки, сколько бы задач ни было у пользователя.
+
+        :param user_id: ID пользователя.
+        :param session: Асинхронная сессия.
+        :return: AsyncIterator[Sequence[Row]] - Асинхронный итератор пачек строк задач
+        (id, title, body, status, user).
+        """
+        logger.debug("Streaming tasks for user_id: %s", user_id)
+
+        result = await session.stream(
+            STREAM_TASKS_BY_USER,
+            {"user_id": user_id},
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    @classmethod
+    async def get_user_with_tasks(
+        cls,
+        user_id: int,
+        session: AsyncSession,
+    ) -> list[Row] | list[None]:
+        """
+        Проверяет существование пользователя и получает его задачи за один запрос.
+
+        Заменяет связку get_current_user + get_tasks_by_current_user для эндпоинтов,
+        которым от пользователя нужен только ID из токена.
+
+        :param user_id: ID пользователя из токена.
+        :param session: Асинхронная сессия.
+        :return: List[Row] - Список строк задач (id, title, body, status, user),
+        назначенных пользователю.
         """
-        logger.debug(f"Fetching tasks for user_id: {user_id}")
+        logger.debug("Fetching user %s together with tasks", user_id)
+
+        connection = await session.connection()
+        result = await connection.execute(USER_WITH_TASKS, {"user_id": user_id})
+        rows = result.all()
+        if not rows:
+            logger.warning("User not found with ID: %s", user_id)
 
-        stmt = select(TaskModel).where(TaskModel.user == user_id)
-        result = await session.execute(stmt)
-        tasks: list[TaskModel] | list = result.scalars().all()
+            raise HTTPException(status_code=404, detail="User not found")
+        tasks: list[Row] | list = [row for row in rows if row.id is not None]
 
-        logger.info(f"Found {len(tasks)} tasks for user_id: {user_id}")
+        logger.debug("Found %s tasks for user_id: %s", len(tasks), user_id)
         return tasks
 
+    @classmethod
+    def task_params(
+        cls,
+        user_id: int,
+        task_id: int | None = None,
+        task_title: str | None = None,
+    ) -> dict[str, int | str | None]:
+        """
+        Собирает параметры условия TASK_OF_USER для поиска задачи по ID или названию.
+
+        Если передан ID, название не учитывается (передаётся как None).
+
+        :param user_id: ID пользователя.
+        :param task_id: ID задачи.
+        :param task_title: Название задачи.
+        :return: Dict[str, int | str | None] - Параметры user_id, task_id и task_title.
+        """
+        if task_id:
+            task_title = None
+        elif not task_title:
+            logger.warning("Not enough data to find task (User: %s)", user_id)
+
+            raise HTTPException(status_code=400, detail="Not enough data")
+
+        return {"user_id": user_id, "task_id": task_id, "task_title": task_title}
+
     @classmethod
     async def get_task_by_id_or_title(
         cls,
@@ -84,37 +276,77 @@ class ServiceRepository:
         """
         Получает задачу по ID или названию, принадлежащую указанному пользователю.
 
+        Поиск по ID и по названию выполняется одним и тем же запросом TASK_BY_ID_OR_TITLE.
+
         :param session: Асинхронная сессия.
         :param user_id: ID пользователя.
         :param task_id: ID задачи.
         :param task_title: Название задачи.
         :return: TaskModel - Объект задачи, если задача найдена, иначе None.
         """
-        if task_id is not None:
-            logger.debug(f"Search task by ID: {task_id} (User: {user_id})")
+        params = cls.task_params(user_id, task_id, task_title)
+        logger.debug("Search task: %s (User: %s)", task_id or task_title, user_id)
 
-            stmt = (
-                select(TaskModel)
-                .where(TaskModel.user == user_id)
-                .where(TaskModel.id == task_id)
-            )
-        elif task_title is not None:
-            logger.debug(f"Search task by title: '{task_title}' (User: {user_id})")
-
-            stmt = (
-                select(TaskModel)
-                .where(TaskModel.user == user_id)
-                .where(TaskModel.title == task_title)
-            )
-        else:
-            raise HTTPException(status_code=400, detail="Not enough data")
-        result = await session.execute(stmt)
+        result = await session.execute(TASK_BY_ID_OR_TITLE, params)
         task: TaskModel | None = result.scalar_one_or_none()
         if task is None:
-            logger.warning(f"Task not found for user {user_id}")
+            logger.warning("Task not found for user %s", user_id)
 
             raise HTTPException(status_code=404, detail="Task not found")
-        logger.info(f"Found task with task_id: {task.id} for user_id: {user_id}")
+        logger.debug("Found task with task_id: %s for user_id: %s", task.id, user_id)
+
+        return task
+
+    @classmethod
+    async def get_task_with_user_check(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        task_id: int | None = None,
+        task_title: str | None = None,
+    ) -> TaskModel:
+        """
+        Проверяет существование пользователя и получает его задачу параллельно.
+
+        Запросы независимы, поэтому проверка пользователя выполняется в отдельной сессии
+        (на отдельном соединении пула) одновременно с поиском задачи. Согласованный снимок
+        данных здесь не нужен: задача и так ищется с фильтром по ID пользователя.
+
+        :param session: Асинхронная сессия.
+        :param user_id: ID пользователя из токена.
+        :param task_id: ID задачи.
+        :param task_title: Название задачи.
+        :return: TaskModel - Объект задачи.
+        """
+        find_task = partial(
+            cls.get_task_by_id_or_title,
+            session=session,
+            user_id=user_id,
+            task_id=task_id,
+            task_title=task_title,
+        )
+        if isinstance(session.bind, AsyncConnection) or isinstance(
+            session.bind.pool, SINGLE_CONNECTION_POOLS
+        ):
+            # Сессия привязана к одному соединению (или пул выдаёт одно соединение):
+            # второго соединения взять неоткуда, запросы выполняются последовательно.
+            user = await session.get(UserModel, user_id)
+            task = await find_task() if user is not None else None
+        else:
+            async with AsyncSession(bind=session.bind) as user_session:
+                user, task = await asyncio.gather(
+                    user_session.get(UserModel, user_id),
+                    find_task(),
+                    return_exceptions=True,
+                )
+            if isinstance(user, BaseException):
+                raise user
+        if user is None:
+            logger.warning("User not found with ID: %s", user_id)
+
+            raise HTTPException(status_code=404, detail="User not found")
+        if isinstance(task, BaseException):
+            raise task
 
         return task
 
@@ -140,43 +372,33 @@ class ServiceRepository:
         update_data = task_for_update.model_dump(exclude_unset=True)
         if not update_data:
             logger.warning(
-                f"Update skipped: No fields provided for task (User: {user_id})"
+                "Update skipped: No fields provided for task (User: %s)", user_id
             )
 
             raise HTTPException(status_code=422, detail="No fields to update")
-        if task_id:
-            logger.debug(f"Searching task ID {task_id} for update (User: {user_id})")
-
-            stmt = (
-                select(TaskModel)
-                .where(TaskModel.user == user_id)
-                .where(TaskModel.id == task_id)
-            )
-        elif task_title:
-            logger.debug(f"Searching task '{task_title}' for update (User: {user_id})")
-
-            stmt = (
-                select(TaskModel)
-                .where(TaskModel.user == user_id)
-                .where(TaskModel.title == task_title)
-            )
-        else:
-            logger.error(f"Update failed: Not enough data provided (User: {user_id})")
-
-            raise HTTPException(status_code=400, detail="Not enough data")
-
-        result = await session.execute(stmt)
+        params = cls.task_params(user_id, task_id, task_title)
+        logger.debug("Updating task %s (User: %s)", task_id or task_title, user_id)
+
+        result = await session.execute(
+            update_task_of_user(frozenset(update_data)),
+            {
+                **params,
+                **{f"new_{field}": value for field, value in update_data.items()},
+            },
+        )
         updating_task: TaskModel | None = result.scalar_one_or_none()
         if updating_task is None:
             logger.warning(
-                f"Update failed: Task not found (User: {user_id}, Search: {task_id or task_title})"
+                "Update failed: Task not found (User: %s, Search: %s)",
+                user_id,
+                task_id or task_title,
             )
 
             raise HTTPException(status_code=404, detail="Task not found")
-        for key, value in update_data.items():
-            setattr(updating_task, key, value)
         await session.commit()
-        logger.info(f"Task {updating_task.id} successfully updated by user {user_id}")
+        logger.debug(
+            "Task %s successfully updated by user %s", updating_task.id, user_id
+        )
 
         return updating_task
 
@@ -187,7 +409,7 @@ class ServiceRepository:
         task_id: int,
         task_title: str,
         user_id: int,
-    ) -> TaskModel:
+    ) -> Row:
         """
         Удаляет задачу по ID или названию, принадлежащую указанному пользователю.
 
@@ -195,43 +417,23 @@ class ServiceRepository:
         :param task_id: ID задачи.
         :param task_title: Название задачи.
         :param user_id: ID пользователя.
-        :return: TaskModel - Удаленный объект задачи.
+        :return: Row - Строка с полями id и title удаленной задачи.
         """
-        if task_id:
-            logger.debug(f"Searching task ID {task_id} for delete (User: {user_id})")
-
-            task_id = int(task_id)
-            stmt = (
-                select(TaskModel)
-                .where(TaskModel.user == user_id)
-                .where(TaskModel.id == task_id)
-            )
-        elif task_title:
-            logger.debug(f"Searching task '{task_title}' for delete (User: {user_id})")
+        params = cls.task_params(user_id, task_id, task_title)
+        logger.debug("Deleting task %s (User: %s)", task_id or task_title, user_id)
 
-            stmt = (
-                select(TaskModel)
-                .where(TaskModel.user == user_id)
-                .where(TaskModel.title == task_title)
-            )
-        else:
-            logger.error(f"Delete failed: Missing identifiers for user {user_id}")
-
-            raise HTTPException(status_code=400, detail="Not enough data")
-        result = await session.execute(stmt)
-        task_for_delete: TaskModel | None = result.scalar_one_or_none()
+        result = await session.execute(DELETE_TASK_OF_USER, params)
+        task_for_delete: Row | None = result.first()
         if task_for_delete is None:
-            logger.warning(f"Delete failed: Task not found for user {user_id}")
+            logger.warning("Delete failed: Task not found for user %s", user_id)
 
             raise HTTPException(status_code=404, detail="Task not found")
-        logger.info(
-            f"Deleting task ID {task_for_delete.id} ('{task_for_delete.title}')"
-        )
-
-        await session.delete(task_for_delete)
         await session.commit()
-        logger.info(
-            f"Task ID {task_for_delete.id} successfully deleted by user {user_id}"
+        logger.debug(
+            "Task ID %s ('%s') successfully deleted by user %s",
+            task_for_delete.id,
+            task_for_delete.title,
+            user_id,
         )
 
         return task_for_delete
@@ -2,13 +2,67 @@
 Репозиторий операций над сущностью Task — асинхронный слой доступа к данным.
 """
 
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache
+
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, delete, insert, select, update
+from sqlalchemy.sql import Update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.task_manager.models import TaskModel, UserModel
+from src.task_manager.models import TaskModel
 from src.task_manager.schemas import TaskCreate, TaskUpdate
+from src.task_manager.database_core import STREAM_BATCH_SIZE
 from src.task_manager.logger_core import logger
 
+FOREIGN_KEY_VIOLATION = "23503"
+
+# Запросы собираются один раз при импорте: одинаковый объект выражения при каждом вызове
+# гарантирует попадание в кэш скомпилированных выражений SQLAlchemy.
+ALL_TASKS = select(TaskModel)
+STREAM_ALL_TASKS = ALL_TASKS.execution_options(yield_per=STREAM_BATCH_SIZE)
+DELETE_TASK_BY_ID = (
+    delete(TaskModel)
+    .where(TaskModel.id == bindparam("task_id"))
+    .returning(TaskModel.id, TaskModel.title, TaskModel.user)
+    .execution_options(synchronize_session=False)
+)
+
+
+@lru_cache(maxsize=16)
+def update_task_by_id(fields: frozenset[str]) -> Update:
+    """
+    Возвращает UPDATE ... RETURNING для задачи по ID с заданным набором изменяемых полей.
+
+    Новые значения передаются параметрами new_<поле>, поэтому для каждого набора полей
+    выражение строится и компилируется один раз.
+
+    :param fields: Имена изменяемых полей задачи.
+    :return: Update - Выражение UPDATE с параметрами task_id и new_<поле>.
+    """
+    return (
+        update(TaskModel)
+        .where(TaskModel.id == bindparam("task_id"))
+        .values({field: bindparam(f"new_{field}") for field in sorted(fields)})
+        .returning(TaskModel)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Проверяет, вызвана ли ошибка нарушением внешнего ключа.
+
+    PostgreSQL сообщает код SQLSTATE 23503, SQLite — только текст ошибки.
+
+    :param error: Исключение IntegrityError от SQLAlchemy.
+    :return: True, если нарушен внешний ключ, иначе False.
+    """
+    if getattr(error.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+        return True
+
+    return "FOREIGN KEY constraint failed" in str(error.orig)
+
 
 class TaskRepository:
     """
@@ -31,13 +85,32 @@ class TaskRepository:
         """
         logger.debug("Fetching all tasks from the database.")
 
-        stmt = select(TaskModel)
-        result = await session.execute(stmt)
+        result = await session.execute(ALL_TASKS)
         tasks = result.scalars().all()
-        logger.info(f"Retrieved {len(tasks)} tasks in total.")
+        logger.debug("Retrieved %s tasks in total.", len(tasks))
 
         return tasks
 
+    @classmethod
+    async def stream_all(
+        cls,
+        session: AsyncSession,
+    ) -> AsyncIterator[Sequence[TaskModel]]:
+        """
+        Отдаёт все задачи из базы данных пачками по STREAM_BATCH_SIZE строк.
+
+        Строки читаются через серверный курсор (yield_per), поэтому в памяти одновременно
+        находится не больше одной пачки.
+
+        :param session: Асинхронная сессия.
+        :return: AsyncIterator[Sequence[TaskModel]] - Асинхронный итератор пачек объектов задач.
+        """
+        logger.debug("Streaming all tasks from the database.")
+
+        result = await session.stream_scalars(STREAM_ALL_TASKS)
+        async for partition in result.partitions():
+            yield partition
+
     @classmethod
     async def get_one(
         cls,
@@ -51,16 +124,17 @@ class TaskRepository:
         :param session: Асинхронная сессия.
         :return: TaskModel - Объект задачи, если задача найдена.
         """
-        logger.debug(f"Fetching task with ID: {task_id}")
+        logger.debug("Fetching task with ID: %s", task_id)
 
-        stmt = select(TaskModel).where(TaskModel.id == task_id)
-        result = await session.execute(stmt)
-        task = result.scalar_one_or_none()
+        # session.get сначала ищет объект в identity map сессии: повторные запросы одной
+        # и той же записи в рамках запроса (например, из get_current_user и обработчика)
+        # не обращаются к базе данных.
+        task = await session.get(TaskModel, task_id)
         if task is None:
-            logger.warning(f"Task with ID {task_id} not found.")
+            logger.warning("Task with ID %s not found.", task_id)
 
             raise HTTPException(status_code=404, detail="Task not found")
-        logger.debug(f"Task found: {task.title}")
+        logger.debug("Task found: %s", task.title)
 
         return task
 
@@ -77,32 +151,77 @@ class TaskRepository:
         :param session: Асинхронная сессия.
         :return: TaskModel - Добавленный объект задачи.
         """
-        logger.info(f"Attempting to add a new task for user ID: {new_task.user}")
+        logger.debug("Attempting to add a new task for user ID: %s", new_task.user)
 
-        stmt = select(UserModel).where(UserModel.id == new_task.user)
-        result = await session.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-        if existing_user is None:
+        # Существование пользователя проверяет внешний ключ tasks.user -> users.id:
+        # отдельный SELECT не нужен. SAVEPOINT откатывает только неудачный INSERT.
+        added_task = TaskModel(**new_task.model_dump())
+        try:
+            async with session.begin_nested():
+                session.add(added_task)
+        except IntegrityError as e:
+            if not is_foreign_key_violation(e):
+                raise
             logger.error(
-                f"Failed to add task: User with ID {new_task.user} does not exist."
+                "Failed to add task: User with ID %s does not exist.", new_task.user
             )
 
             raise HTTPException(
                 status_code=404,
                 detail="User not found",
-            )
-        logger.debug(f"User {new_task.user} validated. Creating task object.")
-
-        task_dict = new_task.dict()
-        added_task = TaskModel(**task_dict)
-        session.add(added_task)
+            ) from None
         await session.commit()
-        logger.info(
-            f"Task successfully created with ID: {added_task.id} (Title: '{added_task.title}')"
+        logger.debug(
+            "Task successfully created with ID: %s (Title: '%s')",
+            added_task.id,
+            added_task.title,
         )
 
         return added_task
 
+    @classmethod
+    async def add_tasks(
+        cls,
+        new_tasks: list[TaskCreate],
+        session: AsyncSession,
+    ) -> list[TaskModel]:
+        """
+        Добавляет несколько задач одним INSERT ... RETURNING.
+
+        SQLAlchemy отправляет все строки пакетно (insertmanyvalues), а
+        sort_by_parameter_order=True гарантирует, что задачи возвращаются в том же порядке,
+        в котором были переданы.
+
+        :param new_tasks: Список объектов TaskCreate с данными новых задач.
+        :param session: Асинхронная сессия.
+        :return: List[TaskModel] - Добавленные объекты задач в порядке входного списка.
+        """
+        if not new_tasks:
+            logger.warning("Bulk insert skipped: No tasks provided.")
+
+            raise HTTPException(status_code=422, detail="No tasks to add")
+        logger.debug("Attempting to add %s tasks in bulk.", len(new_tasks))
+
+        stmt = insert(TaskModel).returning(TaskModel, sort_by_parameter_order=True)
+        try:
+            async with session.begin_nested():
+                result = await session.scalars(
+                    stmt, [task.model_dump() for task in new_tasks]
+                )
+                added_tasks = list(result)
+        except IntegrityError as e:
+            if not is_foreign_key_violation(e):
+                raise
+            logger.error(
+                "Failed to add tasks in bulk: One of the users does not exist."
+            )
+
+            raise HTTPException(status_code=404, detail="User not found") from None
+        await session.commit()
+        logger.debug("%s tasks successfully created in bulk.", len(added_tasks))
+
+        return added_tasks
+
     @classmethod
     async def update_task(
         cls,
@@ -120,20 +239,25 @@ class TaskRepository:
         """
         update_data = task_for_update.model_dump(exclude_unset=True)
         if not update_data:
-            logger.warning(f"Update skipped for task ID {task_id}: No fields provided.")
+            logger.warning(
+                "Update skipped for task ID %s: No fields provided.", task_id
+            )
 
             raise HTTPException(status_code=422, detail="No data to update")
-        stmt = select(TaskModel).where(TaskModel.id == task_id)
-        result = await session.execute(stmt)
-        task = result.scalar_one_or_none()
+        result = await session.execute(
+            update_task_by_id(frozenset(update_data)),
+            {
+                "task_id": task_id,
+                **{f"new_{field}": value for field, value in update_data.items()},
+            },
+        )
+        task: TaskModel | None = result.scalar_one_or_none()
         if task is None:
-            logger.warning(f"Update failed: Task with ID {task_id} not found.")
+            logger.warning("Update failed: Task with ID %s not found.", task_id)
 
             raise HTTPException(status_code=404, detail="Task not found")
-        for key, value in update_data.items():
-            setattr(task, key, value)
         await session.commit()
-        logger.info(f"Task ID {task_id} successfully updated.")
+        logger.debug("Task ID %s successfully updated.", task_id)
 
         return task
 
@@ -142,27 +266,28 @@ class TaskRepository:
         cls,
         task_id: int,
         session: AsyncSession,
-    ) -> TaskModel | None:
+    ) -> Row | None:
         """
         Удаляет задачу из базы данных.
 
         :param task_id: ID задачи.
         :param session: Асинхронная сессия.
-        :return: TaskModel - Удаленный объект задачи.
+        :return: Row - Строка с полями id, title и user удаленной задачи или None,
+        если задача не найдена.
         """
-        logger.info(f"Attempting to delete task with ID: {task_id}")
+        logger.debug("Attempting to delete task with ID: %s", task_id)
 
-        stmt = select(TaskModel).where(TaskModel.id == task_id)
-        result = await session.execute(stmt)
-        task_for_delete = result.scalar_one_or_none()
+        result = await session.execute(DELETE_TASK_BY_ID, {"task_id": task_id})
+        task_for_delete: Row | None = result.first()
         if task_for_delete is None:
-            logger.warning(f"Delete failed: Task with ID {task_id} not found.")
+            logger.warning("Delete failed: Task with ID %s not found.", task_id)
 
-            raise HTTPException(status_code=404, detail="Task not found")
-        logger.info(
-            f"Task ID {task_for_delete.id} ('{task_for_delete.title}') successfully deleted."
+            return None
+        await session.commit()
+        logger.debug(
+            "Task ID %s ('%s') successfully deleted.",
+            task_for_delete.id,
+            task_for_delete.title,
         )
 
-        await session.delete(task_for_delete)
-        await session.commit()
         return task_for_delete
@@ -2,13 +2,23 @@
 Репозиторий операций над сущностью User — асинхронный слой доступа к данным.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.task_manager.models import UserModel
+from src.task_manager.password_core import hash_password
 from src.task_manager.schemas import UserCreate, UserUpdate
+from src.task_manager.database_core import STREAM_BATCH_SIZE
 from src.task_manager.logger_core import logger
 
+# Список пользователей читается на уровне Core: выбираются ровно поля схемы DbUser,
+# строки не превращаются в объекты моделей и не попадают в identity map сессии.
+USERS_LIST = select(UserModel.id, UserModel.name, UserModel.email)
+STREAM_ALL_USERS = select(UserModel).execution_options(yield_per=STREAM_BATCH_SIZE)
+
 
 class UserRepository:
     """
@@ -22,22 +32,42 @@ class UserRepository:
     async def get_all(
         cls,
         session: AsyncSession,
-    ) -> list[UserModel] | list[None]:
+    ) -> list[Row] | list[None]:
         """
         Получает список всех пользователей из базы данных.
 
         :param session: Асинхронная сессия
-        :return: List[UserModel] - Список объектов пользователей.
+        :return: List[Row] - Список строк пользователей (id, name, email).
         """
         logger.debug("Fetching all users from the database.")
 
-        stmt = select(UserModel)
-        result = await session.execute(stmt)
-        users = result.scalars().all()
-        logger.info(f"Retrieved {len(users)} users in total.")
+        connection = await session.connection()
+        result = await connection.execute(USERS_LIST)
+        users: list[Row] | list = result.all()
+        logger.debug("Retrieved %s users in total.", len(users))
 
         return users
 
+    @classmethod
+    async def stream_all(
+        cls,
+        session: AsyncSession,
+    ) -> AsyncIterator[Sequence[UserModel]]:
+        """
+        Отдаёт всех пользователей из базы данных пачками по STREAM_BATCH_SIZE строк.
+
+        Строки читаются через серверный курсор (yield_per), поэтому в памяти одновременно
+        находится не больше одной пачки.
+
+        :param session: Асинхронная сессия.
+        :return: AsyncIterator[Sequence[UserModel]] - Асинхронный итератор пачек объектов пользователей.
+        """
+        logger.debug("Streaming all users from the database.")
+
+        result = await session.stream_scalars(STREAM_ALL_USERS)
+        async for partition in result.partitions():
+            yield partition
+
     @classmethod
     async def get_one(
         cls,
@@ -51,16 +81,17 @@ class UserRepository:
         :param session: Асинхронная сессия.
         :return: UserModel - Объект пользователя, если пользователь найден.
         """
-        logger.debug(f"Fetching user with ID: {user_id}")
+        logger.debug("Fetching user with ID: %s", user_id)
 
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
+        # session.get сначала ищет объект в identity map сессии: повторные запросы одной
+        # и той же записи в рамках запроса (например, из get_current_user и обработчика)
+        # не обращаются к базе данных.
+        user = await session.get(UserModel, user_id)
         if user is None:
-            logger.warning(f"User with ID {user_id} not found.")
+            logger.warning("User with ID %s not found.", user_id)
 
             raise HTTPException(status_code=404, detail="User not found")
-        logger.debug(f"User found: {user.name}")
+        logger.debug("User found: %s", user.name)
 
         return user
 
@@ -77,14 +108,18 @@ class UserRepository:
         :param session: Асинхронная сессия.
         :return: UserModel - Добавленный объект пользователя.
         """
-        logger.info(f"Attempting to add new user. Email: {user.email}")
+        logger.debug("Attempting to add new user. Email: %s", user.email)
 
-        user_dict = user.dict()
+        user_dict = user.model_dump()
+        # scrypt нагружает CPU, поэтому хеширование выполняется в пуле потоков.
+        user_dict["password"] = await asyncio.to_thread(
+            hash_password, user_dict["password"]
+        )
         new_user = UserModel(**user_dict)
         session.add(new_user)
         await session.commit()
-        logger.info(
-            f"User successfully added. ID: {new_user.id}, Email: {new_user.email}"
+        logger.debug(
+            "User successfully added. ID: %s, Email: %s", new_user.id, new_user.email
         )
 
         return new_user
@@ -106,16 +141,20 @@ class UserRepository:
         """
         update_data = user_update.model_dump(exclude_unset=True)
         if not update_data:
-            logger.warning(f"Update skipped for user ID {user_id}: No fields provided.")
+            logger.warning(
+                "Update skipped for user ID %s: No fields provided.", user_id
+            )
 
             raise HTTPException(status_code=422, detail="No fields to update")
-        logger.info(f"Attempting to update user ID {user_id}.")
+        if update_data.get("password") is not None:
+            update_data["password"] = await asyncio.to_thread(
+                hash_password, update_data["password"]
+            )
+        logger.debug("Attempting to update user ID %s.", user_id)
 
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await session.execute(stmt)
-        user_for_update = result.scalar_one_or_none()
+        user_for_update = await session.get(UserModel, user_id)
         if user_for_update is None:
-            logger.warning(f"Update failed: User with ID {user_id} not found.")
+            logger.warning("Update failed: User with ID %s not found.", user_id)
 
             raise HTTPException(
                 status_code=404,
@@ -125,7 +164,7 @@ class UserRepository:
             setattr(user_for_update, key, value)
 
         await session.commit()
-        logger.info(f"User ID {user_id} successfully updated.")
+        logger.debug("User ID %s successfully updated.", user_id)
 
         return user_for_update
 
@@ -142,17 +181,15 @@ class UserRepository:
         :param session: Асинхронная сессия.
         :return: UserModel - Удаленный объект пользователя.
         """
-        logger.info(f"Attempting to delete user with ID: {user_id}")
+        logger.debug("Attempting to delete user with ID: %s", user_id)
 
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await session.execute(stmt)
-        user_for_delete = result.scalar_one_or_none()
+        user_for_delete = await session.get(UserModel, user_id)
         if user_for_delete is None:
-            logger.warning(f"Delete failed: User with ID {user_id} not found.")
+            logger.warning("Delete failed: User with ID %s not found.", user_id)
 
             raise HTTPException(status_code=404, detail="User not found")
         await session.delete(user_for_delete)
         await session.commit()
-        logger.info(f"Deletion committed for user ID {user_id}.")
+        logger.debug("Deletion committed for user ID %s.", user_id)
 
         return user_for_delete
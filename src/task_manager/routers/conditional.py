@@ -0,0 +1,58 @@
+"""
+Условные GET-запросы: ETag и ответ 304 Not Modified по заголовку If-None-Match.
+"""
+
+from hashlib import blake2b
+
+from fastapi import Request, Response, status
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def make_etag(content: bytes) -> str:
+    """
+    Вычисляет сильный ETag по содержимому ответа.
+
+    :param content: Тело ответа (JSON-байты).
+    :return: str - ETag в кавычках, например "3f2a...".
+    """
+    return f'"{blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Проверяет, совпадает ли ETag с одним из значений заголовка If-None-Match.
+
+    Сравнение слабое (RFC 9110): префикс W/ у значений клиента не учитывается.
+
+    :param request: Входящий запрос.
+    :param etag: ETag текущего ответа.
+    :return: bool - True, если клиент уже имеет актуальную версию ответа.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def json_response_with_etag(request: Request, content: bytes) -> Response:
+    """
+    Возвращает JSON-ответ с заголовком ETag или пустой ответ 304, если клиент прислал
+    совпадающий If-None-Match.
+
+    :param request: Входящий запрос.
+    :param content: Готовое тело ответа (JSON-байты).
+    :return: Response - Ответ 200 с телом и ETag либо 304 Not Modified без тела.
+    """
+    etag = make_etag(content)
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    return Response(content=content, media_type=JSON_MEDIA_TYPE, headers={"ETag": etag})
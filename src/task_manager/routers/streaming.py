@@ -0,0 +1,45 @@
+"""
+Потоковая отдача списков в формате NDJSON (по одному JSON-объекту на строку).
+"""
+
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache
+
+from pydantic import BaseModel, TypeAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@lru_cache(maxsize=8)
+def row_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """
+    Возвращает TypeAdapter схемы строки, созданный один раз на схему.
+
+    :param schema: Pydantic-схема строки.
+    :return: TypeAdapter - Валидатор и сериализатор схемы.
+    """
+    return TypeAdapter(schema)
+
+
+async def ndjson_lines(
+    batches: AsyncIterator[Sequence[object]],
+    schema: type[BaseModel],
+) -> AsyncIterator[bytes]:
+    """
+    Преобразует асинхронный поток пачек ORM-объектов в строки NDJSON.
+
+    Каждая пачка сериализуется в один блок байтов сразу по мере получения из курсора,
+    поэтому весь список никогда не хранится в памяти. Объект проверяется схемой и сразу
+    сериализуется в JSON средствами pydantic-core, без промежуточного словаря.
+
+    :param batches: Асинхронный итератор пачек ORM-объектов.
+    :param schema: Pydantic-схема для сериализации объекта (from_attributes=True).
+    :return: AsyncIterator[bytes] - Блоки строк NDJSON, каждая строка оканчивается переводом строки.
+    """
+    adapter = row_adapter(schema)
+    async for batch in batches:
+        yield b"".join(
+            adapter.dump_json(adapter.validate_python(item, from_attributes=True))
+            + b"\n"
+            for item in batch
+        )
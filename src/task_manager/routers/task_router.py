@@ -3,11 +3,15 @@ API-маршруты для работы с задачами (Task).
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Response, status
+from fastapi.responses import StreamingResponse
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.task_manager.database_core.database import get_db
+from src.task_manager.cache_core import get_cache, invalidate_user_tasks
+from src.task_manager.database_core.database import get_db, get_db_tx
 from src.task_manager.repositories import TaskRepository
-from src.task_manager.schemas import DbTask, TaskCreate, TaskUpdate
+from src.task_manager.schemas import DB_TASK_LIST, DbTask, TaskCreate, TaskUpdate
 from src.task_manager.logger_core import logger
+from .streaming import NDJSON_MEDIA_TYPE, ndjson_lines
 
 router = APIRouter(
     prefix="/tasks",
@@ -15,24 +19,56 @@ router = APIRouter(
 )
 
 
-@router.get("", summary="Получить список всех задач", response_model=list[DbTask])
+@router.get(
+    "",
+    summary="Получить список всех задач",
+    responses={status.HTTP_200_OK: {"model": list[DbTask]}},
+)
 async def get_tasks(
     session: AsyncSession = Depends(get_db),
-) -> list[DbTask] | list[None]:
+) -> Response:
     """
     Получает список всех задач.
 
+    Список сериализуется заранее созданным TypeAdapter напрямую в JSON-байты, минуя
+    повторную валидацию response_model в FastAPI.
+
     :param session: Асинхронная сессия.
-    :return: List[DbTask] - Список объектов DbTask, представляющих задачи.
+    :return: Response - JSON-массив объектов DbTask, представляющих задачи.
     """
-    logger.info("API Request: Fetching all tasks.")
+    logger.debug("API Request: Fetching all tasks.")
 
     tasks = await TaskRepository.get_all(
         session=session,
     )
-    logger.info(f"API Response: Returning {len(tasks)} tasks.")
+    logger.debug("API Response: Returning %s tasks.", len(tasks))
 
-    return tasks
+    return Response(
+        content=DB_TASK_LIST.dump_json(DB_TASK_LIST.validate_python(tasks)),
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/stream",
+    summary="Получить список всех задач потоком NDJSON",
+    response_class=StreamingResponse,
+)
+async def stream_tasks(
+    session: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Отдаёт все задачи потоком NDJSON (по одной задаче на строку), не собирая список в памяти.
+
+    :param session: Асинхронная сессия.
+    :return: StreamingResponse - Потоковый ответ с задачами в формате NDJSON.
+    """
+    logger.debug("API Request: Streaming all tasks.")
+
+    return StreamingResponse(
+        ndjson_lines(TaskRepository.stream_all(session=session), DbTask),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
 
 
 @router.get(
@@ -48,14 +84,14 @@ async def get_task(task_id: int, session: AsyncSession = Depends(get_db)) -> DbT
     :param session: Асинхронная сессия.
     :return: DbTask - Объект DbTask, представляющий задачу.
     """
-    logger.info(f"API Request: Fetching task with ID: {task_id}")
+    logger.debug("API Request: Fetching task with ID: %s", task_id)
 
     task = await TaskRepository.get_one(task_id=task_id, session=session)
     if task:
-        logger.info(f"API Response: Task ID {task_id} found and returned.")
+        logger.debug("API Response: Task ID %s found and returned.", task_id)
 
         return task
-    logger.warning(f"API Response (Error): Task ID {task_id} not found.")
+    logger.warning("API Response (Error): Task ID %s not found.", task_id)
 
     raise HTTPException(status_code=404, detail="Task is not exist")
 
@@ -63,17 +99,21 @@ async def get_task(task_id: int, session: AsyncSession = Depends(get_db)) -> DbT
 @router.post("", summary="Создать новую задачу", response_model=DbTask)
 async def add_task(
     task: TaskCreate,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_db_tx),
+    cache: Redis | None = Depends(get_cache),
 ) -> DbTask:
     """
     Создает новую задачу.
 
     :param task: Объект TaskCreate, содержащий данные для новой задачи.
     :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
     :return: DbTask - Объект DbTask, представляющий созданную задачу.
     """
-    logger.info(
-        f"API Request: Creating new task for user ID {task.user} with title '{task.title}'."
+    logger.debug(
+        "API Request: Creating new task for user ID %s with title '%s'.",
+        task.user,
+        task.title,
     )
 
     db_task = await TaskRepository.add_task(
@@ -82,20 +122,54 @@ async def add_task(
     )
     if db_task is None:
         logger.error(
-            f"API Response Error: Failed to create task for user ID {task.user}. TaskRepository returned None."
+            "API Response Error: Failed to create task for user ID %s. TaskRepository returned None.",
+            task.user,
         )
 
         raise HTTPException(status_code=400, detail="Incorrect request")
-    logger.info(
-        f"API Response: Task created successfully. Task ID: {db_task.id}, Title: '{db_task.title}'."
+    await invalidate_user_tasks(cache, db_task.user)
+    logger.debug(
+        "API Response: Task created successfully. Task ID: %s, Title: '%s'.",
+        db_task.id,
+        db_task.title,
     )
 
     return db_task
 
 
+@router.post("/bulk", summary="Создать несколько задач", response_model=list[DbTask])
+async def add_tasks(
+    tasks: list[TaskCreate],
+    session: AsyncSession = Depends(get_db_tx),
+    cache: Redis | None = Depends(get_cache),
+) -> list[DbTask]:
+    """
+    Создает несколько задач за один запрос к базе данных.
+
+    :param tasks: Список объектов TaskCreate с данными новых задач.
+    :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: List[DbTask] - Созданные задачи в том же порядке, что и во входном списке.
+    """
+    logger.debug("API Request: Creating %s tasks in bulk.", len(tasks))
+
+    db_tasks = await TaskRepository.add_tasks(
+        new_tasks=tasks,
+        session=session,
+    )
+    for user_id in {task.user for task in tasks}:
+        await invalidate_user_tasks(cache, user_id)
+    logger.debug("API Response: %s tasks created successfully.", len(db_tasks))
+
+    return db_tasks
+
+
 @router.put("/{task_id}", summary="Обновить информацию о задаче", response_model=DbTask)
 async def update_task(
-    task_id: int, task_for_update: TaskUpdate, session: AsyncSession = Depends(get_db)
+    task_id: int,
+    task_for_update: TaskUpdate,
+    session: AsyncSession = Depends(get_db_tx),
+    cache: Redis | None = Depends(get_cache),
 ) -> DbTask:
     """
     Обновляет информацию о задаче по ее ID.
@@ -103,9 +177,10 @@ async def update_task(
     :param task_id: ID задачи.
     :param task_for_update: Объект TaskUpdate, содержащий новые данные для задачи.
     :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
     :return: DbTask - Объект DbTask, представляющий обновленную задачу.
     """
-    logger.info(f"API Request: Updating task ID {task_id}.")
+    logger.debug("API Request: Updating task ID %s.", task_id)
 
     task = await TaskRepository.update_task(
         task_id=task_id,
@@ -113,38 +188,43 @@ async def update_task(
         session=session,
     )
     if task:
-        logger.info(f"API Response: Task ID {task_id} successfully updated.")
+        await invalidate_user_tasks(cache, task.user, task.id)
+        logger.debug("API Response: Task ID %s successfully updated.", task_id)
 
         return task
 
-    logger.error(f"API Response Error: Failed to update task ID {task_id}.")
+    logger.error("API Response Error: Failed to update task ID %s.", task_id)
     raise HTTPException(status_code=404, detail="Task is not exist")
 
 
 @router.delete(
     "/{task_id}",
     summary="Удалить задачу",
+    status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_task(
     task_id: int,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_db_tx),
+    cache: Redis | None = Depends(get_cache),
 ) -> Response:
     """
     Удаляет задачу по ее ID.
 
     :param task_id: ID задачи.
     :param session: Асинхронная сессия.
-    :return: Dict[str, str] - Словарь с сообщением об успешном удалении.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - Пустой ответ со статусом 204 No Content.
     """
-    logger.info(f"API Request: Deleting task with ID: {task_id}")
+    logger.debug("API Request: Deleting task with ID: %s", task_id)
 
-    task_for_delete = await TaskRepository.delete_task(
+    deleted_task = await TaskRepository.delete_task(
         task_id=task_id,
         session=session,
     )
-    if not task_for_delete:
-        logger.error(f"API Response Error: Failed to delete task ID {task_id}.")
+    if deleted_task is None:
+        logger.error("API Response Error: Failed to delete task ID %s.", task_id)
         raise HTTPException(status_code=404, detail="Task is not exists")
+    await invalidate_user_tasks(cache, deleted_task.user, deleted_task.id)
 
-    logger.info(f"API Response: Task ID {task_id} successfully deleted.")
+    logger.debug("API Response: Task ID %s successfully deleted.", task_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
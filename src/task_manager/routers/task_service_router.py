@@ -2,15 +2,44 @@
 API-эндпоинты сервиса работы с задачами текущего аутентифицированного пользователя.
 """
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Query, status, Response
+from collections.abc import Mapping
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    status,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.task_manager.cache_core import (
+    cache_get,
+    cache_set,
+    get_cache,
+    invalidate_user_tasks,
+    user_task_key,
+    user_tasks_key,
+)
 from src.task_manager.database_core.database import get_db
 from src.task_manager.repositories import TaskRepository, ServiceRepository
-from src.task_manager.schemas import TaskUpdate, TaskStatus, TaskCreateService, DbTask
-from src.task_manager.security import get_current_user
+from src.task_manager.schemas import (
+    DB_TASK_LIST,
+    TaskUpdate,
+    TaskStatus,
+    TaskCreateService,
+    DbTask,
+)
+from src.task_manager.security import get_current_user, get_token
 
 from src.task_manager.logger_core import logger
 from src.task_manager.models import UserModel
+from .conditional import json_response_with_etag
+from .streaming import NDJSON_MEDIA_TYPE, ndjson_lines
 
 router = APIRouter(
     prefix="/service",
@@ -19,96 +48,219 @@ router = APIRouter(
 
 
 @router.get(
-    "/get_all_tasks", summary="Список задач пользователя", response_model=list[DbTask]
+    "/get_all_tasks",
+    summary="Список задач пользователя",
+    responses={status.HTTP_200_OK: {"model": list[DbTask]}},
 )
 async def get_all_tasks(
-    user: UserModel = Depends(get_current_user), session: AsyncSession = Depends(get_db)
-) -> list[DbTask] | list[None]:
+    request: Request,
+    payload: Mapping = Depends(get_token),
+    session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
+) -> Response:
     """
     Получает список всех задач, принадлежащих текущему пользователю.
 
-    :param user: Объект текущего пользователя, полученный через Dependency Injection.
+    Пользователь не загружается отдельно через get_current_user: проверка его
+    существования и выборка задач выполняются одним запросом. Готовый JSON кэшируется
+    в Redis по ключу user:{user_id}:tasks, поэтому повторный запрос не обращается к БД.
+    Ответ содержит ETag; если он совпадает с If-None-Match клиента, возвращается
+    304 Not Modified без тела.
+
+    :param request: Входящий запрос (заголовок If-None-Match).
+    :param payload: Декодированный payload токена, полученный через Dependency Injection.
     :param session: Асинхронная сессия.
-    :return: List[DbTask] - Список объектов DbTask, представляющих задачи
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - JSON-массив объектов DbTask, представляющих задачи, или 304.
     """
-    logger.info(f"API Request: User ID {user.id} fetching all their tasks.")
+    user_id = payload["uid"]
+    logger.debug("API Request: User ID %s fetching all their tasks.", user_id)
 
-    tasks = await ServiceRepository.get_tasks_by_current_user(
-        user_id=user.id,
+    cache_key = user_tasks_key(user_id)
+    content = await cache_get(cache, cache_key)
+    if content is not None:
+        logger.debug("API Response: User ID %s received tasks from cache.", user_id)
+
+        return json_response_with_etag(request, content)
+
+    tasks = await ServiceRepository.get_user_with_tasks(
+        user_id=user_id,
         session=session,
     )
-    logger.info(f"API Response: User ID {user.id} received {len(tasks)} tasks.")
+    content = DB_TASK_LIST.dump_json(DB_TASK_LIST.validate_python(tasks))
+    await cache_set(cache, cache_key, content)
+    logger.debug("API Response: User ID %s received %s tasks.", user_id, len(tasks))
 
-    return tasks
+    return json_response_with_etag(request, content)
 
 
 @router.get(
-    "/get_specific_task",
-    summary="Прочесть конкретную задачу",
-    response_model=DbTask,
+    "/get_all_tasks_stream",
+    summary="Список задач пользователя потоком NDJSON",
+    response_class=StreamingResponse,
 )
-async def get_specific_task(
-    task_id: int | str | None = Query(default=None, description="ID задачи для чтения"),
-    task_title: str | None = Query(
-        default=None, description="Название задачи для чтения"
-    ),
+async def get_all_tasks_stream(
     user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
-) -> DbTask:
+) -> StreamingResponse:
     """
-    Получает конкретную задачу по ее ID или названию, принадлежащую текущему пользователю.
+    Отдаёт все задачи текущего пользователя потоком NDJSON (по одной задаче на строку).
+
+    Список не собирается в памяти: задачи читаются из курсора пачками и сразу
+    отправляются клиенту, поэтому потребление памяти не зависит от числа задач.
+
+    :param user: Объект текущего пользователя, полученный через Dependency Injection.
+    :param session: Асинхронная сессия.
+    :return: StreamingResponse - Потоковый ответ с задачами в формате NDJSON.
+    """
+    logger.debug("API Request: User ID %s streaming all their tasks.", user.id)
+
+    return StreamingResponse(
+        ndjson_lines(
+            ServiceRepository.stream_tasks_by_user(user_id=user.id, session=session),
+            DbTask,
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
 
+
+async def read_user_task(
+    user_id: int,
+    session: AsyncSession,
+    cache: Redis | None,
+    task_id: int | None = None,
+    task_title: str | None = None,
+) -> Response:
+    """
+    Общая часть эндпоинтов чтения задачи: кэш, поиск в БД и сериализация.
+
+    Поиск по ID и по названию выполняется одним запросом. Найденная задача кэшируется
+    в Redis по ключу user:{user_id}:task:{task_id}; из кэша она читается при запросе по ID.
+
+    :param user_id: ID пользователя из токена.
+    :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
     :param task_id: ID задачи.
     :param task_title: Название задачи.
-    :param user:  Объект текущего пользователя, полученный через Dependency Injection.
-    :param session: Асинхронная сессия.
-    :return: DbTask - Объект DbTask, представляющий задачу.
+    :return: Response - JSON-объект DbTask, представляющий задачу.
     """
-    if task_id:
-        logger.info(f"API Request: User ID {user.id} requesting task by ID: {task_id}.")
+    logger.debug(
+        "API Request: User ID %s requesting task: %s.", user_id, task_id or task_title
+    )
 
-        task = await ServiceRepository.get_task_by_id_or_title(
-            task_id=int(task_id),
-            user_id=int(user.id),
-            session=session,
-        )
-        if task is None:
-            logger.warning(
-                f"API Response Error: User ID {user.id} failed to get task ID {task_id}."
+    if task_id:
+        content = await cache_get(cache, user_task_key(user_id, task_id))
+        if content is not None:
+            logger.debug(
+                "API Response: User ID %s received task ID %s from cache.",
+                user_id,
+                task_id,
             )
 
-            raise HTTPException(status_code=404, detail="Task not found")
-        logger.info(f"API Response: User ID {user.id} received task ID {task_id}.")
+            return Response(content=content, media_type="application/json")
 
-        return task
+    task = await ServiceRepository.get_task_with_user_check(
+        task_id=task_id,
+        task_title=task_title,
+        user_id=user_id,
+        session=session,
+    )
+    content = DbTask.model_validate(task).model_dump_json().encode()
+    await cache_set(cache, user_task_key(user_id, task.id), content)
+    logger.debug("API Response: User ID %s received task ID %s.", user_id, task.id)
 
-    elif task_title:
-        logger.info(
-            f"API Request: User ID {user.id} requesting task by title: '{task_title}'."
-        )
+    return Response(content=content, media_type="application/json")
 
-        task = await ServiceRepository.get_task_by_id_or_title(
-            task_title=task_title,
-            user_id=int(user.id),
-            session=session,
-        )
-        if task is None:
-            logger.warning(
-                f"API Response Error: User ID {user.id} failed to get task title '{task_title}'."
-            )
 
-            raise HTTPException(status_code=404, detail="Task not found")
-        logger.info(
-            f"API Response: User ID {user.id} received task with title '{task_title}'."
-        )
+@router.get(
+    "/task/{task_id}",
+    summary="Прочесть задачу по ID",
+    responses={status.HTTP_200_OK: {"model": DbTask}},
+)
+async def get_task_by_id(
+    task_id: int,
+    payload: Mapping = Depends(get_token),
+    session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
+) -> Response:
+    """
+    Получает задачу текущего пользователя по ее ID.
 
-        return task
-    else:
-        logger.warning(
-            f"API Response Error: User ID {user.id} made a bad request - no task ID or title provided."
-        )
+    :param task_id: ID задачи.
+    :param payload: Декодированный payload токена, полученный через Dependency Injection.
+    :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - JSON-объект DbTask, представляющий задачу.
+    """
+    return await read_user_task(payload["uid"], session, cache, task_id=task_id)
 
-        raise HTTPException(status_code=400, detail="Incorrect request")
+
+@router.get(
+    "/task/by-title/{task_title}",
+    summary="Прочесть задачу по названию",
+    responses={status.HTTP_200_OK: {"model": DbTask}},
+)
+async def get_task_by_title(
+    task_title: str,
+    payload: Mapping = Depends(get_token),
+    session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
+) -> Response:
+    """
+    Получает задачу текущего пользователя по ее названию.
+
+    :param task_title: Название задачи.
+    :param payload: Декодированный payload токена, полученный через Dependency Injection.
+    :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - JSON-объект DbTask, представляющий задачу.
+    """
+    return await read_user_task(payload["uid"], session, cache, task_title=task_title)
+
+
+@router.get(
+    "/get_specific_task",
+    summary="Прочесть конкретную задачу",
+    responses={status.HTTP_200_OK: {"model": DbTask}},
+    deprecated=True,
+)
+async def get_specific_task(
+    task_id: int | str | None = Query(default=None, description="ID задачи для чтения"),
+    task_title: str | None = Query(
+        default=None, description="Название задачи для чтения"
+    ),
+    payload: Mapping = Depends(get_token),
+    session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
+) -> Response:
+    """
+    Получает конкретную задачу по ее ID или названию, принадлежащую текущему пользователю.
+
+    Устарел: используйте GET /service/task/{task_id} и /service/task/by-title/{task_title}.
+
+    :param task_id: ID задачи.
+    :param task_title: Название задачи.
+    :param payload: Декодированный payload токена, полученный через Dependency Injection.
+    :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - JSON-объект DbTask, представляющий задачу.
+    """
+    # Пустой task_id (?task_id=) означает поиск по названию, поэтому параметр
+    # принимается строкой и приводится к int вручную, без валидации FastAPI.
+    try:
+        task_id = int(task_id) if task_id else None
+    except ValueError:
+        logger.warning("API Request Error: Invalid task_id: %s", task_id)
+
+        raise HTTPException(status_code=422, detail="task_id must be an integer")
+
+    return await read_user_task(
+        payload["uid"],
+        session,
+        cache,
+        task_id=task_id,
+        task_title=task_title,
+    )
 
 
 @router.post(
@@ -117,11 +269,12 @@ async def get_specific_task(
     response_model=DbTask,
 )
 async def create_task(
-    title: str = Form(...),
-    body: str = Form(...),
+    title: str = Form(..., min_length=2, max_length=200),
+    body: str = Form(..., min_length=2, max_length=200),
     status: TaskStatus = Form(...),
     user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
 ) -> DbTask:
     """
     Создает новую задачу для текущего пользователя.
@@ -131,31 +284,40 @@ async def create_task(
     :param status: Статус задачи.
     :param user: Объект текущего пользователя, полученный через Dependency Injection.
     :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
     :return: DbTask - Объект DbTask, представляющий созданную задачу.
     """
-    user = int(user.id)
-    logger.info(
-        f"API Request: User ID {user} creating a new task. Title: '{title}', Status: {status.value}."
+    user_id = user.id
+    logger.debug(
+        "API Request: User ID %s creating a new task. Title: '%s', Status: %s.",
+        user_id,
+        title,
+        status.value,
     )
 
-    task = TaskCreateService(
+    # Поля уже проверены FastAPI на уровне Form (ограничения те же, что в TaskBase),
+    # поэтому схема собирается без повторной валидации.
+    task = TaskCreateService.model_construct(
         title=title,
         body=body,
         status=status,
-        user=user,
+        user=user_id,
     )
     db_task = await TaskRepository.add_task(
         new_task=task,
         session=session,
     )
-    logger.info(
-        f"API Response: Task successfully created for user ID {user}. New task ID: {db_task.id}."
+    logger.debug(
+        "API Response: Task successfully created for user ID %s. New task ID: %s.",
+        user_id,
+        db_task.id,
     )
 
     if db_task is None:
-        logger.error(f"API Response Error: User ID {user} failed to create task.")
+        logger.error("API Response Error: User ID %s failed to create task.", user_id)
 
         raise HTTPException(status_code=400, detail="Incorrect request")
+    await invalidate_user_tasks(cache, user_id)
 
     return db_task
 
@@ -169,6 +331,7 @@ async def update_task(
     task_title: str | None = None,
     user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
 ) -> DbTask:
     """
     Обновляет существующую задачу, принадлежащую текущему пользователю.
@@ -178,55 +341,41 @@ async def update_task(
     :param task_title: Название задачи.
     :param user:  Объект текущего пользователя, полученный через Dependency Injection.
     :param session: Асинхронная сессия.
+    :param cache: Клиент Redis (None, если кэш отключён).
     :return: DbTask - Объект DbTask, представляющий обновленную задачу.
     """
-    if task_id:
-        logger.info(f"API Request: User ID {user.id} updating task {task_id}.")
-
-        task = await ServiceRepository.update_task(
-            user_id=int(user.id),
-            task_for_update=task_for_update,
-            task_id=int(task_id),
-            session=session,
-        )
-        logger.info(
-            f"API Response: Task with id: {task_id} successfully updated by user ID {user.id}."
-        )
-
-        return task
-
-    elif task_title:
-        logger.info(f"API Request: User ID {user.id} updating task {task_title}.")
-
-        task = await ServiceRepository.update_task(
-            user_id=int(user.id),
-            task_for_update=task_for_update,
-            task_title=task_title,
-            session=session,
-        )
-        logger.info(
-            f"API Response: Task '{task_title}' successfully updated by user ID {user.id}."
-        )
-
-        return task
+    logger.debug(
+        "API Request: User ID %s updating task %s.", user.id, task_id or task_title
+    )
 
-    else:
-        logger.error(
-            f"API Request Error: User ID {user.id} provided neither task_id nor task_title for update."
-        )
+    task = await ServiceRepository.update_task(
+        user_id=user.id,
+        task_for_update=task_for_update,
+        task_id=task_id,
+        task_title=task_title,
+        session=session,
+    )
+    await invalidate_user_tasks(cache, user.id, task.id)
+    logger.debug(
+        "API Response: Task with id: %s successfully updated by user ID %s.",
+        task.id,
+        user.id,
+    )
 
-        raise HTTPException(status_code=400, detail="Incorrect request")
+    return task
 
 
 @router.delete(
     "/delete_task",
     summary="Удалить задачу",
+    status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_task(
     task_id: int | None = None,
     task_title: str | None = None,
     user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    cache: Redis | None = Depends(get_cache),
 ) -> Response:
     """
     Удаляет существующую задачу, принадлежащую текущему пользователю.
@@ -235,22 +384,25 @@ async def delete_task(
     :param task_title: Название задачи.
     :param user: Объект текущего пользователя, полученный через Dependency Injection.
     :param session: Асинхронная сессия.
-    :return: DbTask - Объект DbTask, представляющий удаленную задачу.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - Пустой ответ со статусом 204 No Content.
     """
-    logger.info(f"API Request: User ID {user.id} attempting to delete task.")
+    logger.debug("API Request: User ID %s attempting to delete task.", user.id)
 
     deleted_task = await ServiceRepository.delete_task(
         task_id=task_id,
         task_title=task_title,
-        user_id=int(user.id),
+        user_id=user.id,
         session=session,
     )
     if not deleted_task:
         logger.error(
-            f"API Response Error: Unexpected error deleting task  for user ID {user.id}."
+            "API Response Error: Unexpected error deleting task  for user ID %s.",
+            user.id,
         )
 
         raise HTTPException(status_code=404, detail="Task is not exists")
+    await invalidate_user_tasks(cache, user.id, deleted_task.id)
 
-    logger.info(f"API Response: Task successfully deleted for user ID {user.id}.")
+    logger.debug("API Response: Task successfully deleted for user ID %s.", user.id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -6,14 +6,20 @@ from fastapi import (
     APIRouter,
     HTTPException,
     Depends,
+    Request,
     status,
     Response,
 )
+from fastapi.responses import StreamingResponse
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.task_manager.database_core.database import get_db
+from src.task_manager.cache_core import get_cache, invalidate_user_tasks
+from src.task_manager.database_core.database import get_db, get_db_tx
 from src.task_manager.repositories import UserRepository
-from src.task_manager.schemas import DbUser, UserCreate, UserUpdate
+from src.task_manager.schemas import DB_USER_LIST, DbUser, UserCreate, UserUpdate
 from src.task_manager.logger_core import logger
+from .conditional import json_response_with_etag
+from .streaming import NDJSON_MEDIA_TYPE, ndjson_lines
 
 router = APIRouter(
     prefix="/users",
@@ -22,23 +28,55 @@ router = APIRouter(
 
 
 @router.get(
-    "", summary="Получить список всех пользователей", response_model=list[DbUser]
+    "",
+    summary="Получить список всех пользователей",
+    responses={status.HTTP_200_OK: {"model": list[DbUser]}},
 )
 async def get_users(
+    request: Request,
     session: AsyncSession = Depends(get_db),
-) -> list[DbUser] | list[None]:
+) -> Response:
     """
     Получает список всех пользователей.
 
+    Список сериализуется заранее созданным TypeAdapter напрямую в JSON-байты, минуя
+    повторную валидацию response_model в FastAPI. Ответ содержит ETag; если он совпадает
+    с If-None-Match клиента, возвращается 304 Not Modified без тела.
+
+    :param request: Входящий запрос (заголовок If-None-Match).
     :param session: Асинхронная сессия.
-    :return: List[DbUser] - Список объектов DbUser, представляющих пользователей.
+    :return: Response - JSON-массив объектов DbUser, представляющих пользователей, или 304.
     """
-    logger.info("API Request: Fetching all users.")
+    logger.debug("API Request: Fetching all users.")
 
     users = await UserRepository.get_all(session=session)
-    logger.info(f"API Response: Returning {len(users)} users.")
+    logger.debug("API Response: Returning %s users.", len(users))
+
+    return json_response_with_etag(
+        request, DB_USER_LIST.dump_json(DB_USER_LIST.validate_python(users))
+    )
+
+
+@router.get(
+    "/stream",
+    summary="Получить список всех пользователей потоком NDJSON",
+    response_class=StreamingResponse,
+)
+async def stream_users(
+    session: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Отдаёт всех пользователей потоком NDJSON (по одному пользователю на строку).
 
-    return users
+    :param session: Асинхронная сессия.
+    :return: StreamingResponse - Потоковый ответ с пользователями в формате NDJSON.
+    """
+    logger.debug("API Request: Streaming all users.")
+
+    return StreamingResponse(
+        ndjson_lines(UserRepository.stream_all(session=session), DbUser),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
 
 
 @router.get(
@@ -55,24 +93,26 @@ async def get_user(
     :param session: Асинхронная сессия.
     :return: DbUser - Объект DbUser, представляющий пользователя.
     """
-    logger.info(f"API Request: Fetching user with ID: {user_id}.")
+    logger.debug("API Request: Fetching user with ID: %s.", user_id)
 
     user = await UserRepository.get_one(user_id=user_id, session=session)
     if user:
-        logger.info(
-            f"API Response: User ID {user_id} found and returned. Username: {user.name}."
+        logger.debug(
+            "API Response: User ID %s found and returned. Username: %s.",
+            user_id,
+            user.name,
         )
 
         return user
 
-    logger.warning(f"API Response Error: User with ID {user_id} not found.")
+    logger.warning("API Response Error: User with ID %s not found.", user_id)
     raise HTTPException(status_code=404, detail="User is not exist")
 
 
 @router.post("", summary="Создать нового пользователя", response_model=DbUser)
 async def add_user(
     user: UserCreate,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_db_tx),
 ) -> DbUser:
     """
     Создает нового пользователя.
@@ -81,19 +121,21 @@ async def add_user(
     :param session: Асинхронная сессия.
     :return: DbUser - Объект DbUser, представляющий созданного пользователя.
     """
-    logger.info(f"API Request: Creating new user. Username: {user.name}.")
+    logger.debug("API Request: Creating new user. Username: %s.", user.name)
 
     db_user = await UserRepository.add_user(
         user=user,
         session=session,
     )
     if db_user:
-        logger.info(
-            f"API Response: User successfully created. User ID: {db_user.id}, Username: {db_user.name}."
+        logger.debug(
+            "API Response: User successfully created. User ID: %s, Username: %s.",
+            db_user.id,
+            db_user.name,
         )
         return db_user
     logger.error(
-        f"API Response Error: Failed to create user with username {user.name}."
+        "API Response Error: Failed to create user with username %s.", user.name
     )
 
     raise HTTPException(status_code=400, detail="Incorrect Data")
@@ -105,7 +147,7 @@ async def add_user(
 async def update_user(
     user_id: int,
     user_for_update: UserUpdate,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_db_tx),
 ) -> DbUser:
     """
     Обновляет информацию о пользователе по его ID.
@@ -115,7 +157,7 @@ async def update_user(
     :param session: Асинхронная сессия.
     :return: DbUser - Объект DbUser, представляющий обновленного пользователя.
     """
-    logger.info(f"API Request: Updating user ID {user_id}.")
+    logger.debug("API Request: Updating user ID %s.", user_id)
 
     user = await UserRepository.update_user(
         user_id=user_id,
@@ -123,10 +165,10 @@ async def update_user(
         session=session,
     )
     if user:
-        logger.info(f"API Response: User ID {user_id} successfully updated.")
+        logger.debug("API Response: User ID %s successfully updated.", user_id)
 
         return user
-    logger.error(f"API Response Error: Error updating user ID {user_id}.")
+    logger.error("API Response Error: Error updating user ID %s.", user_id)
 
     raise HTTPException(status_code=404, detail="User is not exist")
 
@@ -134,29 +176,36 @@ async def update_user(
 @router.delete(
     "/{user_id}",
     summary="Удалить пользователя",
+    status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_user(
-    user_id: int, session: AsyncSession = Depends(get_db)
+    user_id: int,
+    session: AsyncSession = Depends(get_db_tx),
+    cache: Redis | None = Depends(get_cache),
 ) -> Response:
     """
     Удаляет пользователя по его ID.
 
     :param user_id: ID пользователя.
     :param session: Асинхронная сессия.
-    :return: Dict[str, str] - Словарь с сообщением об успешном удалении.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - Пустой ответ со статусом 204 No Content.
     """
-    logger.info(f"API Request: Deleting user with ID: {user_id}.")
+    logger.debug("API Request: Deleting user with ID: %s.", user_id)
 
     user_for_delete = await UserRepository.delete_user(
         user_id=user_id,
         session=session,
     )
     if not user_for_delete:
-        logger.warning(f"API Response Error: User ID {user_id} not found for deletion.")
+        logger.warning(
+            "API Response Error: User ID %s not found for deletion.", user_id
+        )
 
         raise HTTPException(status_code=404, detail="User is not exists")
+    await invalidate_user_tasks(cache, user_id, all_tasks=True)
 
-    logger.info(f"API Response: User ID {user_id} successfully deleted.")
+    logger.debug("API Response: User ID %s successfully deleted.", user_id)
     return Response(
         status_code=status.HTTP_204_NO_CONTENT,
     )
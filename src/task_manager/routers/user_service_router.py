@@ -2,10 +2,13 @@
 Маршруты сервиса для работы с учетной записью пользователя.
 """
 
+import orjson
 from fastapi import APIRouter, Form, Depends, HTTPException, status, Response
 from pydantic import EmailStr
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.task_manager.database_core.database import get_db
+from src.task_manager.cache_core import get_cache, invalidate_user_tasks
+from src.task_manager.database_core.database import get_db, get_db_tx
 from src.task_manager.repositories import UserRepository, ServiceRepository
 from src.task_manager.schemas import DbUser, UserCreate, TokenInfo, UserUpdate
 from src.task_manager.security import encode_jwt, get_current_user
@@ -18,7 +21,7 @@ router = APIRouter(prefix="/service_user", tags=["Сервис (работа с
 
 @router.post("/create_user", summary="Создание учетной записи", response_model=DbUser)
 async def create_new_user(
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_db_tx),
     name: str | None = Form(...),
     email: str | EmailStr = Form(...),
     password: str | None = Form(...),
@@ -32,8 +35,10 @@ async def create_new_user(
     :param password: Пароль пользователя.
     :return: DbUser - Объект DbUser, представляющий пользователя.
     """
-    logger.info(
-        f"API Request: Attempting to create new user. Name: '{name}', Email: '{email}'."
+    logger.debug(
+        "API Request: Attempting to create new user. Name: '%s', Email: '%s'.",
+        name,
+        email,
     )
 
     if name is None or email is None or password is None:
@@ -43,30 +48,38 @@ async def create_new_user(
         user=new_user,
         session=session,
     )
-    logger.info(
-        f"API Response: User successfully created. User ID: {db_user.id}, Name: '{db_user.name}', Email: '{db_user.email}'."
+    logger.debug(
+        "API Response: User successfully created. User ID: %s, Name: '%s', Email: '%s'.",
+        db_user.id,
+        db_user.name,
+        db_user.email,
     )
 
     return db_user
 
 
 @router.post(
-    "/login", summary="Регистрация для работы с задачами", response_model=TokenInfo
+    "/login",
+    summary="Регистрация для работы с задачами",
+    responses={status.HTTP_200_OK: {"model": TokenInfo}},
 )
 async def login_for_create_task(
     session: AsyncSession = Depends(get_db),
     username: str | None = Form(...),
     password: str | None = Form(...),
-) -> TokenInfo:
+) -> Response:
     """
     Выполнить аутентификацию пользователя и вернуть JWT.
 
+    Ответ в формате TokenInfo сериализуется через orjson напрямую в байты, минуя
+    валидацию response_model и jsonable_encoder.
+
     :param session: Асинхронная сессия.
     :param username: Имя пользователя.
     :param password: Пароль пользователя.
-    :return: DbUser - Объект DbUser, представляющий пользователя.
+    :return: Response - JSON-объект TokenInfo с токеном доступа.
     """
-    logger.info(f"API Request: User login attempt for username: '{username}'.")
+    logger.debug("API Request: User login attempt for username: '%s'.", username)
 
     user_for_encode = await ServiceRepository.login_user(
         username=username,
@@ -76,12 +89,17 @@ async def login_for_create_task(
     if user_for_encode is None:
         raise HTTPException(status_code=404, detail="User not found")
     jwt_payload = {"sub": str(user_for_encode.id), "username": user_for_encode.name}
-    token = await encode_jwt(payload=jwt_payload)
-    logger.info(
-        f"API Response: User '{username}' (ID: {user_for_encode.id}) successfully logged in. JWT issued."
+    token = encode_jwt(payload=jwt_payload)
+    logger.debug(
+        "API Response: User '%s' (ID: %s) successfully logged in. JWT issued.",
+        username,
+        user_for_encode.id,
     )
 
-    return TokenInfo(access_token=token, token_type="Bearer")
+    return Response(
+        content=orjson.dumps({"access_token": token, "token_type": "Bearer"}),
+        media_type="application/json",
+    )
 
 
 @router.put("/change_user", summary="Изменение учетной записи", response_model=DbUser)
@@ -102,7 +120,7 @@ async def change_user(
     :param user: Объект текущего пользователя, полученный через Dependency Injection.
     :return: DbUser - Объект DbUser, представляющий пользователя.
     """
-    logger.info(f"Received request to update user with ID: {user.id}")
+    logger.debug("Received request to update user with ID: %s", user.id)
 
     user_for_change = UserUpdate(name=name, email=email, password=password)
     changed_user = await UserRepository.update_user(
@@ -110,7 +128,7 @@ async def change_user(
         user_update=user_for_change,
         session=session,
     )
-    logger.info(f"Successfully updated user with ID: {user.id}")
+    logger.debug("Successfully updated user with ID: %s", user.id)
 
     return changed_user
 
@@ -118,25 +136,31 @@ async def change_user(
 @router.delete(
     "/delete_user",
     summary="Удалить учетную запись",
+    status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_current_user(
     session: AsyncSession = Depends(get_db),
     user: UserModel = Depends(get_current_user),
+    cache: Redis | None = Depends(get_cache),
 ) -> Response:
     """
     Удалить учетную запись текущего пользователя.
 
+    Вместе с учетной записью из кэша удаляются все закэшированные задачи пользователя.
+
     :param session: Асинхронная сессия.
     :param user: Объект текущего пользователя, полученный через Dependency Injection.
-    :return: Dict[str, str] - Словарь с сообщением об успешном удалении.
+    :param cache: Клиент Redis (None, если кэш отключён).
+    :return: Response - Пустой ответ со статусом 204 No Content.
     """
-    logger.info(f"Received request to delete user with ID: {user.id}")
+    logger.debug("Received request to delete user with ID: %s", user.id)
 
     user_for_delete = await UserRepository.delete_user(user_id=user.id, session=session)
     if not user_for_delete:
-        logger.warning(f"User with ID: {user.id} not found for deletion.")
+        logger.warning("User with ID: %s not found for deletion.", user.id)
 
         raise HTTPException(status_code=404, detail="User is not exists")
+    await invalidate_user_tasks(cache, user.id, all_tasks=True)
 
-    logger.info(f"Successfully deleted user with ID: {user.id}")
+    logger.debug("Successfully deleted user with ID: %s", user.id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
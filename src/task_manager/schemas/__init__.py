@@ -2,11 +2,20 @@
 Модуль-пакет экспорта Pydantic‑схем (aggregate exports).
 """
 
-from .task_schemas import TaskBase, TaskCreate, TaskUpdate, DbTask
-from .user_schemas import UserBase, UserCreate, UserUpdate, DbUser
-from .service_schemas import UserLogin, TokenInfo, TaskStatus, TaskCreateService
+from .task_schemas import (
+    DB_TASK_LIST,
+    TaskBase,
+    TaskCreate,
+    TaskUpdate,
+    DbTask,
+    TaskStatus,
+)
+from .user_schemas import DB_USER_LIST, UserBase, UserCreate, UserUpdate, DbUser
+from .service_schemas import UserLogin, TokenInfo, TaskCreateService
 
 __all__ = [
+    "DB_TASK_LIST",
+    "DB_USER_LIST",
     "DbTask",
     "DbUser",
     "TaskBase",
@@ -2,9 +2,9 @@
 Pydantic-схемы и вспомогательные типы для сервиса аутентификации и управления задачами.
 """
 
-from enum import Enum
 from pydantic import EmailStr, BaseModel, Field
 from src.task_manager.schemas import UserBase, TaskCreate
+from src.task_manager.schemas.task_schemas import TaskStatus
 
 
 class UserLogin(UserBase):
@@ -31,21 +31,6 @@ class TokenInfo(BaseModel):
     token_type: str
 
 
-class TaskStatus(str, Enum):
-    """
-    Перечисление для представления возможных статусов задачи.
-
-    Attributes:
-        New (str): Задача новая.
-        In_process (str): Задача в процессе выполнения.
-        Finished (str): Задача завершена.
-    """
-
-    New = "New"
-    In_process = "In_process"
-    Finished = "Finished"
-
-
 class TaskCreateService(TaskCreate):
     """
     Схема для создания задачи, используемая в сервисе.
@@ -2,8 +2,23 @@
 Pydantic-схемы (модели) для объектов "задача" (Task).
 """
 
-from typing import Literal
-from pydantic import BaseModel, Field, ConfigDict
+from enum import Enum
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+
+
+class TaskStatus(str, Enum):
+    """
+    Перечисление для представления возможных статусов задачи.
+
+    Attributes:
+        New (str): Задача новая.
+        In_process (str): Задача в процессе выполнения.
+        Finished (str): Задача завершена.
+    """
+
+    New = "New"
+    In_process = "In_process"
+    Finished = "Finished"
 
 
 class TaskBase(BaseModel):
@@ -13,18 +28,19 @@ class TaskBase(BaseModel):
     Attributes:
         title (str): Заголовок задачи.  Обязательное поле, длина от 2 до 200 символов.
         body (str): Описание задачи.  Обязательное поле, длина от 2 до 200 символов.
-        status (Literal["New", "In process", "Finished"]): Статус задачи.  Обязательное поле, может принимать одно из предопределенных значений.
+        status (TaskStatus): Статус задачи.  Обязательное поле, может принимать одно из значений TaskStatus.
         user (int): ID пользователя, которому назначена задача.  Обязательное поле, должно быть больше или равно 1.
 
-    model_config = ConfigDict(extra='forbid') - Запрещает передачу дополнительных полей, не определенных в модели.
+    model_config = ConfigDict(extra='forbid', use_enum_values=True) - Запрещает передачу дополнительных полей,
+    не определенных в модели; статус хранится строкой, как в столбце БД.
     """
 
     title: str = Field(..., min_length=2, max_length=200)
     body: str = Field(..., min_length=2, max_length=200)
-    status: Literal["New", "In process", "Finished"] = Field(...)
+    status: TaskStatus = Field(...)
     user: int = Field(..., ge=1)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", use_enum_values=True)
 
 
 class TaskCreate(TaskBase):
@@ -46,13 +62,14 @@ class TaskUpdate(BaseModel):
         Если не указан, заголовок не изменяется.
         body (str, optional): Новое описание задачи.  Длина от 20 до 200 символов.
         Если не указан, описание не изменяется.
-        status (Literal["New", "In process", "Finished"]): Новый статус задачи. Обязательное поле, может принимать одно
-        из предопределенных значений.
+        status (TaskStatus): Новый статус задачи. Обязательное поле, может принимать одно из значений TaskStatus.
     """
 
     title: str = Field(default=None, min_length=2, max_length=20)
     body: str = Field(default=None, min_length=20, max_length=200)
-    status: Literal["New", "In_process", "Finished"] = Field(...)
+    status: TaskStatus = Field(...)
+
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class DbTask(BaseModel):
@@ -66,8 +83,7 @@ class DbTask(BaseModel):
         status (str): Статус задачи.
         user (int | str | None): ID пользователя, которому назначена задача.  Может быть целым числом, строкой или None.
 
-    class Config:
-        from_attributes = True -  Позволяет создавать объекты DbTask из объектов, имеющих атрибуты с такими же именами.
+    model_config = ConfigDict(from_attributes=True) - Позволяет создавать объекты DbTask из объектов, имеющих атрибуты с такими же именами.
     """
 
     id: int
@@ -76,5 +92,8 @@ class DbTask(BaseModel):
     status: str
     user: int | str | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Валидатор и сериализатор списка задач собираются один раз при импорте.
+DB_TASK_LIST = TypeAdapter(list[DbTask])
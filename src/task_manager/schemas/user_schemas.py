@@ -2,7 +2,7 @@
 Pydantic‑схемы (модели) для сущности "пользователь" (User).
 """
 
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, TypeAdapter
 
 
 class UserBase(BaseModel):
@@ -50,18 +50,26 @@ class UserUpdate(UserBase):
     password: str = Field(default=None, min_length=8)
 
 
-class DbUser(UserBase):
+class DbUser(BaseModel):
     """
     Схема для представления пользователя в базе данных.
 
+    Пароль (его хеш) в схему не входит и не возвращается клиентам.
+
     Attributes:
         id (int): ID пользователя.
+        name (str): Имя пользователя.
+        email (EmailStr): Email пользователя.
 
-    class Config:
-        from_attributes = True - Позволяет создавать объекты DbUser из объектов, имеющих атрибуты с такими же именами.
+    model_config = ConfigDict(from_attributes=True) - Позволяет создавать объекты DbUser из объектов, имеющих атрибуты с такими же именами.
     """
 
     id: int
+    name: str
+    email: EmailStr
+
+    model_config = ConfigDict(from_attributes=True)
+
 
-    class Config:
-        from_attributes = True
+# Валидатор и сериализатор списка пользователей собираются один раз при импорте.
+DB_USER_LIST = TypeAdapter(list[DbUser])
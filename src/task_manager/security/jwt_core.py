@@ -2,35 +2,199 @@
 JWT‑утилиты и зависимости FastAPI для аутентификации пользователей.
 """
 
-from datetime import timedelta, datetime, UTC
+import base64
+import binascii
+import hmac
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import timedelta
+from hashlib import blake2b
+from types import MappingProxyType
 
 import jwt
+import orjson
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import InvalidTokenError
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAlgorithmError,
+    InvalidSignatureError,
+    InvalidSubjectError,
+    InvalidTokenError,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from dotenv import load_dotenv
-import os
+from src.task_manager.config_core import settings
 from src.task_manager.database_core.database import get_db
 from src.task_manager.repositories import UserRepository
 from src.task_manager.logger_core import logger
 from src.task_manager.models import UserModel
 
-load_dotenv()
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/service_user/login")
 
-SECRET_KEY = os.getenv("SECRET_KEY", "my_secret")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "10"))
+SECRET_KEY = settings.secret_key
+ALGORITHM = settings.algorithm
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
+
+# Ключ подписи вычисляется один раз при импорте, не при каждом логине.
+SIGNING_KEY = SECRET_KEY.encode()
+# Срок жизни токена по умолчанию в секундах.
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Токены HS256 на ключе по умолчанию подписываются и проверяются напрямую через hmac.digest
+# (однократный вызов OpenSSL, который использует аппаратный SHA-256, если он есть).
+# Другие алгоритмы и ключи обрабатываются PyJWT.
+FAST_ALGORITHM = "HS256"
+
+# Проверенные payload по хешу токена (LRU). Подпись токена при неизменном ключе
+# не меняется, поэтому повторная проверка нужна только после истечения exp.
+# Один и тот же payload отдаётся всем запросам этого токена, поэтому он хранится
+# в неизменяемом виде (MappingProxyType): обработчик не может испортить запись кэша.
+TOKEN_CACHE_SIZE = 10_000
+_token_cache: OrderedDict[bytes, Mapping[str, str | int]] = OrderedDict()
+
+
+def token_cache_key(token: str) -> bytes:
+    """
+    Вычисляет ключ кэша проверенных токенов.
+
+    :param token: JWT в виде строки.
+    :return: bytes - 128-битный хеш blake2b от токена.
+    """
+    return blake2b(token.encode(), digest_size=16).digest()
+
+
+def get_cached_payload(key: bytes) -> Mapping[str, str | int] | None:
+    """
+    Возвращает ранее проверенный payload, если срок действия токена ещё не истёк.
+
+    :param key: Ключ кэша (token_cache_key).
+    :return: Mapping[str, str | int] - payload токена (только для чтения) или None,
+    если его нет в кэше или он истёк.
+    """
+    payload = _token_cache.get(key)
+    if payload is None:
+        return None
+    if payload["exp"] <= time.time():
+        _token_cache.pop(key, None)
+
+        return None
+    _token_cache.move_to_end(key)
+
+    return payload
+
+
+def cache_payload(key: bytes, payload: Mapping[str, str | int]) -> None:
+    """
+    Сохраняет проверенный payload в кэше, вытесняя самый давно использованный.
+
+    Токены без exp не кэшируются: для них нельзя ограничить время жизни записи.
+
+    :param key: Ключ кэша (token_cache_key).
+    :param payload: Декодированный payload токена (только для чтения).
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    if "exp" not in payload:
+        return
+    _token_cache[key] = payload
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+
+def b64url_encode(data: bytes) -> bytes:
+    """
+    Кодирует байты в base64url без выравнивания "=" (RFC 7515).
+
+    :param data: Исходные байты.
+    :return: bytes - Закодированные байты.
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def b64url_decode(data: bytes) -> bytes:
+    """
+    Декодирует base64url без выравнивания "=" (RFC 7515).
+
+    :param data: Закодированные байты.
+    :return: bytes - Исходные байты.
+    """
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+# Заголовок токенов быстрого пути неизменен, поэтому сериализуется один раз при импорте.
+HS256_HEADER_B64 = b64url_encode(orjson.dumps({"alg": FAST_ALGORITHM, "typ": "JWT"}))
+
+
+def sign_hs256(signing_input: bytes) -> bytes:
+    """
+    Вычисляет подпись HMAC-SHA256 ключом по умолчанию.
+
+    :param signing_input: Подписываемые данные (header.payload).
+    :return: bytes - Подпись (32 байта).
+    """
+    return hmac.digest(SIGNING_KEY, signing_input, "sha256")
+
+
+def uses_fast_path(algorithm: str, secret_key: str | bytes) -> bool:
+    """
+    Проверяет, можно ли обработать токен напрямую через hmac без PyJWT.
+
+    :param algorithm: Алгоритм подписи.
+    :param secret_key: Ключ подписи.
+    :return: bool - True для HS256 с ключом по умолчанию.
+    """
+    return algorithm == FAST_ALGORITHM and secret_key in (SIGNING_KEY, SECRET_KEY)
+
+
+def decode_hs256(token: bytes) -> dict[str, str | int]:
+    """
+    Проверяет подпись и срок действия токена HS256, подписанного ключом по умолчанию.
+
+    Ошибки сообщаются теми же исключениями PyJWT, что и jwt.decode.
+
+    :param token: JWT в виде байтов.
+    :return: Dict[str, str | int] - Payload токена.
+    """
+    signing_input, _, signature_b64 = token.rpartition(b".")
+    header_b64, _, payload_b64 = signing_input.partition(b".")
+    if not header_b64 or b"." in payload_b64:
+        raise DecodeError("Not enough segments")
+    try:
+        header = orjson.loads(b64url_decode(header_b64))
+        payload = orjson.loads(b64url_decode(payload_b64))
+        signature = b64url_decode(signature_b64)
+    except (binascii.Error, ValueError) as error:
+        raise DecodeError(f"Invalid segment encoding: {error}") from error
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise DecodeError("Invalid token: header and payload must be JSON objects")
+    if header.get("alg") != FAST_ALGORITHM or "crit" in header:
+        raise InvalidAlgorithmError("The specified alg value is not allowed")
+    if not hmac.compare_digest(sign_hs256(signing_input), signature):
+        raise InvalidSignatureError("Signature verification failed")
+
+    now = time.time()
+    if "exp" in payload:
+        if not isinstance(payload["exp"], int):
+            raise DecodeError("Expiration Time claim (exp) must be an integer.")
+        if payload["exp"] <= now:
+            raise ExpiredSignatureError("Signature has expired")
+    if "nbf" in payload:
+        if not isinstance(payload["nbf"], int):
+            raise DecodeError("Not Before claim (nbf) must be an integer.")
+        if payload["nbf"] > now:
+            raise ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    return payload
 
 
-async def encode_jwt(
+def encode_jwt(
     payload: dict[str, str],
     algorithm: str = ALGORITHM,
     expire_timedelta: timedelta | None = None,
     expire_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES,
-    secret_key: str = SECRET_KEY,
+    secret_key: str | bytes = SIGNING_KEY,
 ) -> str | bytes:
     """
     Создаёт JWT на основе payload.
@@ -42,25 +206,30 @@ async def encode_jwt(
     :param secret_key: Секретный ключ для подписи токена.
     :return: Закодированный JWT (str).
     """
-    logger.info(f"Creating JWT with payload: {payload.get('sub')}")
+    logger.debug("Creating JWT with payload: %s", payload.get("sub"))
 
     to_encode = payload.copy()
-    now = datetime.now(UTC)
     if expire_timedelta:
-        expire = now + expire_timedelta
+        expire_seconds = int(expire_timedelta.total_seconds())
     else:
-        expire = now + timedelta(minutes=expire_minutes)
-    to_encode.update(
-        exp=expire,
-    )
-    encoded = jwt.encode(to_encode, secret_key, algorithm)
-    logger.info("JWT created successfully")
+        expire_seconds = expire_minutes * 60
+    to_encode["exp"] = int(time.time()) + expire_seconds
+    if uses_fast_path(algorithm, secret_key):
+        signing_input = HS256_HEADER_B64 + b"." + b64url_encode(orjson.dumps(to_encode))
+        encoded = (
+            signing_input + b"." + b64url_encode(sign_hs256(signing_input))
+        ).decode()
+    else:
+        encoded = jwt.encode(to_encode, secret_key, algorithm)
+    logger.debug("JWT created successfully")
 
     return encoded
 
 
-async def decode_jwt(
-    access_token: str | bytes, algorithm: str = ALGORITHM, secret_key: str = SECRET_KEY
+def decode_jwt(
+    access_token: str | bytes,
+    algorithm: str = ALGORITHM,
+    secret_key: str | bytes = SIGNING_KEY,
 ) -> dict[str, str]:
     """
     Декодирует и верифицирует JWT.
@@ -70,67 +239,96 @@ async def decode_jwt(
     :param secret_key: Секрет для проверки подписи.
     :return: Декодированный payload (dict) при успешной валидации.
     """
-    logger.info("Decoding JWT")
+    logger.debug("Decoding JWT")
 
     try:
-        decode = jwt.decode(access_token, secret_key, algorithms=[algorithm])
-        logger.info("JWT decoded successfully")
+        if uses_fast_path(algorithm, secret_key):
+            if isinstance(access_token, str):
+                access_token = access_token.encode()
+            decode = decode_hs256(access_token)
+        else:
+            decode = jwt.decode(access_token, secret_key, algorithms=[algorithm])
+        logger.debug("JWT decoded successfully")
 
         return decode
-    except jwt.ExpiredSignatureError:
+    except ExpiredSignatureError:
         logger.warning("Token has expired")
 
         raise HTTPException(status_code=401, detail="Token has expired")
     except InvalidTokenError as e:
-        logger.error(f"Invalid token: {e}")
+        logger.error("Invalid token: %s", e)
 
         raise HTTPException(status_code=401, detail=f"Invalid token: {e}")
 
 
 async def get_token(
     token: str = Depends(oauth2_scheme),
-) -> dict[str, str | int]:
+) -> Mapping[str, str | int]:
     """
     FastAPI dependency: извлекает токен из заголовка Authorization и возвращает декодированный payload.
 
+    Зависимость остаётся async: синхронные зависимости FastAPI выполняет в пуле потоков,
+    а проверка токена быстрее такого переключения.
+
+    Payload уже проверенного токена берётся из кэша до истечения exp, поэтому подпись
+    каждого токена проверяется один раз. Существование пользователя по-прежнему
+    проверяется в базе данных при каждом запросе.
+
+    Claim "sub" по RFC 7519 остаётся строкой; при первой проверке токена он один раз
+    приводится к int и сохраняется в payload под ключом "uid", который и читают обработчики.
+    Payload возвращается только для чтения: тот же объект получают все запросы с этим токеном.
+
     :param token: передаётся автоматически через Depends(oauth2scheme)).
-    :return: payload (dict) полученный из decodejwt.
+    :return: payload (Mapping) полученный из decodejwt, дополненный ключом "uid" (int).
     """
-    logger.info("Getting token from header")
+    logger.debug("Getting token from header")
 
+    key = token_cache_key(token)
+    if (payload := get_cached_payload(key)) is not None:
+        return payload
     try:
-        payload = await decode_jwt(
+        payload = decode_jwt(
             access_token=token,
         )
-        logger.info(f"Token decoded successfully. User ID: {payload.get('sub')}")
+        sub = payload.get("sub")
+        if not isinstance(sub, str) or not (sub.isascii() and sub.isdigit()):
+            raise InvalidSubjectError("Subject (sub) must be a user ID")
+        payload["uid"] = int(sub)
+        payload = MappingProxyType(payload)
+        logger.debug("Token decoded successfully. User ID: %s", sub)
+        cache_payload(key, payload)
 
         return payload
     except InvalidTokenError as error:
-        logger.error(f"Invalid token error: {error}")
+        logger.error("Invalid token error: %s", error)
 
         raise HTTPException(status_code=401, detail=f"invalid token error: {error}")
 
 
 async def get_current_user(
-    payload: dict = Depends(get_token), session: AsyncSession = Depends(get_db)
+    payload: Mapping = Depends(get_token), session: AsyncSession = Depends(get_db)
 ) -> UserModel:
     """
     FastAPI dependency: по payload токена получает объект пользователя из репозитория.
 
-    :param payload: Словарь claims токена, ожидается наличие ключа "sub" (идентификатор пользователя).
+    Пользователь не кэшируется между запросами: приложение работает в нескольких
+    процессах, и удаление или изменение учётной записи в одном из них должно сразу
+    учитываться во всех.
+
+    :param payload: Словарь claims токена из get_token, ключ "uid" - ID пользователя (int).
     :param session: Асинхронная сессия.
     :return: Объект пользователя, возвращаемый UserRepository.get_one.
     """
-    logger.info(f"Getting current user for user ID: {payload.get('sub')}")
+    user_id: int = payload["uid"]
+    logger.debug("Getting current user for user ID: %s", user_id)
 
-    user_id: int | None = payload.get("sub")
     if user := await UserRepository.get_one(
-        user_id=int(user_id),
+        user_id=user_id,
         session=session,
     ):
-        logger.info(f"User found with ID: {user.id}")
+        logger.debug("User found with ID: %s", user.id)
 
         return user
-    logger.warning(f"User not found with ID: {user_id}")
+    logger.warning("User not found with ID: %s", user_id)
 
     raise HTTPException(status_code=401, detail="user not found")
@@ -2,15 +2,54 @@
 Фикстуры pytest для интеграционных/функциональных тестов приложения.
 """
 
+from functools import cache
+
 from httpx import Response, AsyncClient, ASGITransport
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.task_manager.database_core import get_db
+from src.task_manager.database_core import get_db, get_db_tx
 from src.task_manager.main import app
 from src.task_manager.models import UserModel, TaskModel
+from src.task_manager.password_core import hash_password
+from src.task_manager.security import encode_jwt
 from src.task_manager.logger_core import logger
-from tests.test_database import create_test_tables, drop_test_tables, test_session_local
+from tests.test_database import (
+    create_test_tables,
+    dispose_test_engine,
+    drop_test_tables,
+    test_engine,
+    test_session_local,
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Применяет уровень log_level из настроек pytest (pytest.ini или --log-level) к логгеру приложения.
+
+    Логгер приложения явно настроен на DEBUG, поэтому без этого каждый вызов logger.info
+    в приложении и тестах создаёт и форматирует запись, даже если pytest её отбросит.
+
+    :param config: Конфигурация pytest.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    level = config.getoption("log_level") or config.getini("log_level")
+    if level:
+        logger.setLevel(int(level) if level.isdigit() else level.upper())
+
+
+@cache
+def hash_test_password(password: str) -> str:
+    """
+    Хеширует пароль тестового пользователя один раз за прогон тестов.
+
+    scrypt намеренно медленный, а пароли тестовых пользователей одинаковы во всех тестах,
+    поэтому готовый хеш переиспользуется (соль при этом тоже общая, что для тестов неважно).
+
+    :param password: Пароль в открытом виде.
+    :return: Строка с хешем пароля в формате hash_password.
+    """
+    return hash_password(password)
 
 
 @pytest.fixture(
@@ -20,17 +59,19 @@ async def async_test_db() -> None:
     """
     Fixture для создания/удаления таблиц тестовой базы данных.
 
-    Scope: session — выполняется один раз для всего набора тестов.
+    Scope: session — выполняется один раз для всего набора тестов. Тестовый движок
+    создаётся один раз при импорте и закрывается (dispose) только здесь, в конце сессии.
 
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
-    logger.info("Starting async_test_db fixture")
+    logger.debug("Starting async_test_db fixture")
 
     await create_test_tables()
     yield
     await drop_test_tables()
+    await dispose_test_engine()
 
-    logger.info("Finished async_test_db fixture")
+    logger.debug("Finished async_test_db fixture")
 
 
 @pytest.fixture(
@@ -42,138 +83,139 @@ async def async_session(
     """
      Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
 
-    Scope: function — новая сессия для каждой тестовой функции.
+    Scope: function — новая сессия для каждой тестовой функции. Сессия привязана
+    к соединению с открытой внешней транзакцией (join_transaction_mode="create_savepoint"):
+    commit() внутри приложения фиксирует только SAVEPOINT, а после теста внешняя
+    транзакция откатывается, и таблицы возвращаются в исходное состояние без DDL.
 
     :param async_test_db: Fixture для создания/удаления таблиц тестовой базы данных.
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
-    logger.info("Starting async_session fixture")
+    logger.debug("Starting async_session fixture")
+
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        async with test_session_local(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+            logger.debug("Created async session")
 
-    async with test_session_local() as session:
-        logger.info("Created async session")
+            yield session
 
-        yield session
+        await transaction.rollback()
+        logger.debug("Finished async_session fixture, transaction rolled back")
 
-        logger.info("Finished async_session fixture, session closed")
+
+@pytest.fixture(scope="session")
+async def app_client() -> AsyncClient:
+    """
+    Fixture, создающая один AsyncClient (ASGI-транспорт) на весь прогон тестов.
+
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+        logger.debug("Finished app_client fixture, AsyncClient closed")
 
 
 @pytest.fixture(scope="function")
 async def client(
+    app_client: AsyncClient,
     async_session: AsyncSession,
 ) -> AsyncClient:
     """
-    Fixture, создающая TestClient с переопределенной зависимостью getdb.
+    Fixture, возвращающая общий AsyncClient с переопределенными зависимостями get_db и get_db_tx.
 
-    Возвращает TestClient для выполнения синхронных HTTP-запросов к приложению.
+    Клиент создаётся один раз (app_client); для каждого теста переопределяется только
+    сессия базы данных, а после теста переопределения сбрасываются.
 
+    :param app_client: Fixture, создающая один AsyncClient на весь прогон тестов.
     :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
-    logger.info("Starting client fixture")
+    logger.debug("Starting client fixture")
 
     async def override_get_db() -> AsyncSession:
         yield async_session
 
     app.dependency_overrides[get_db] = override_get_db
-    logger.info("Overrode get_db dependency")
+    app.dependency_overrides[get_db_tx] = override_get_db
+    logger.debug("Overrode get_db and get_db_tx dependencies")
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        yield ac
-        logger.info("Finished client fixture, AsyncClient closed")
+    yield app_client
 
     app.dependency_overrides.clear()
-    logger.info("Cleared dependency overrides")
+    logger.debug("Cleared dependency overrides")
 
 
 @pytest.fixture(
     scope="function",
 )
 async def create_test_users(
-    async_session: AsyncSession, client: AsyncClient, num_users: int = 3
+    async_session: AsyncSession, num_users: int = 3
 ) -> list[dict]:
     """
-    Fixture для создания набора тестовых пользователей через API.
+    Fixture для создания набора тестовых пользователей напрямую в базе данных.
+
+    Пользователи добавляются одним многострочным INSERT ... RETURNING, минуя HTTP-запросы к API;
+    создание пользователей через POST /users проверяется отдельными тестами.
 
     :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
-    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
     :param num_users: Требуемое количество создаваемых пользователей (по умолчанию равно трем).
-    :return: Возвращает список созданных пользователей (декодированный JSON ответ).
-    После теста выполняется удаление пользователей через соответствующий API-эндпоинт.
+    :return: Возвращает список созданных пользователей в формате ответа API (пароль в открытом виде).
+    После теста пользователи удаляются откатом транзакции теста (см. async_session).
     """
-    logger.info("Starting create_test_users fixture")
+    logger.debug("Starting create_test_users fixture")
 
-    users_to_create = []
-    for i in range(num_users):
-        user_data = {
+    users_data = [
+        {
             "name": f"testuser_{i + 1}",
             "email": f"testuser_{i + 1}@example.com",
             "password": f"123456789{i + 1}",
         }
-        logger.info(f"Creating user: {user_data}")
-        response: Response = await client.post("/users", json=user_data)
-        assert response.status_code == 200
-        logger.info(f"User created successfully, status code: {response.status_code}")
-
-        response_json = response.json()
-        users_to_create.append(response_json)
-
-    yield users_to_create
-    logger.info("Starting cleanup of created users")
-
-    for user in users_to_create:
-        user_id = user["id"]
-
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await async_session.execute(stmt)
-        user_to_delete = result.scalar_one_or_none()
+        for i in range(num_users)
+    ]
+    result = await async_session.execute(
+        insert(UserModel).returning(UserModel.name, UserModel.id),
+        [
+            {**user_data, "password": hash_test_password(user_data["password"])}
+            for user_data in users_data
+        ],
+    )
+    # Порядок строк RETURNING в многострочном INSERT не гарантирован: ID сопоставляются по имени.
+    user_ids = dict(result.tuples().all())
+    await async_session.commit()
+    logger.debug("Created %s test users", len(user_ids))
 
-        if user_to_delete is not None:
-            logger.info(f"Deleting user with ID: {user_id}")
-            response: Response = await client.delete(
-                f"/users/{user_id}",
-            )
-            assert response.status_code == 204
-            assert response.text == ""
-            logger.info(
-                f"User with ID {user_id} deleted successfully, status code: {response.status_code}"
-            )
+    # Для логина в тестах возвращается исходный пароль (в базе хранится хеш пароля).
+    yield [{**user_data, "id": user_ids[user_data["name"]]} for user_data in users_data]
 
 
 @pytest.fixture(
     scope="function",
 )
 async def get_user_and_jwt(
-    client: AsyncClient,
-    async_session: AsyncSession,
     create_test_users: list[dict],
 ) -> dict[str, dict | str]:
     """
     Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
 
-    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
-    :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
-    :param create_test_users: Fixture для создания набора тестовых пользователей через API.
+    Токен выпускается напрямую через encode_jwt с тем же payload, что и в /service_user/login,
+    поэтому фикстура не выполняет HTTP-запрос и проверку пароля scrypt. Сам логин
+    проверяется отдельными тестами сервисного роутера пользователей.
+
+    :param create_test_users: Fixture для создания набора тестовых пользователей.
     :return: Возвращает словарь {"user": <user_json>, "token": "<access_token>"}.
     """
-    logger.info("Starting get_user_and_jwt fixture")
+    logger.debug("Starting get_user_and_jwt fixture")
 
     user_one = create_test_users[0]
-    logger.info(f"Getting user: {user_one['name']}")
-
-    user_data = {"username": user_one["name"], "password": user_one["password"]}
-    logger.info(f"Sending login request with data: {user_data}")
-
-    response: Response = await client.post(
-        "/service_user/login",
-        data=user_data,
+    token = encode_jwt(
+        payload={"sub": str(user_one["id"]), "username": user_one["name"]}
     )
-    assert response.status_code == 200
-    logger.info(f"Login request successful, status code: {response.status_code}")
-    response_data = response.json()
-    token = response_data["access_token"]
-    logger.info(f"Received token: {token}")
+    logger.debug("Issued token for user: %s", user_one["name"])
 
     return {"user": user_one, "token": token}
 
@@ -182,64 +224,44 @@ async def get_user_and_jwt(
     scope="function",
 )
 async def create_test_tasks(
-    client: AsyncClient,
     async_session: AsyncSession,
     create_test_users: list[dict],
     num_tasks: int = 3,
 ) -> list[dict]:
     """
-     Fixture для создания набора тестовых задач (tasks) через API.
+    Fixture для создания набора тестовых задач (tasks) напрямую в базе данных.
+
+    Задачи добавляются одним многострочным INSERT ... RETURNING, минуя HTTP-запросы к API.
 
-    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
     :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
-    :param create_test_users: Fixture для создания набора тестовых пользователей через API.
+    :param create_test_users: Fixture для создания набора тестовых пользователей.
     :param num_tasks: Требуемое количество создаваемых задач (по умолчанию равно трем).
-    :return: Возвращает список созданных задач (JSON). После теста задачи удаляются через API.
+    :return: Возвращает список созданных задач в формате ответа API. После теста задачи
+    удаляются откатом транзакции теста (см. async_session).
     """
-    logger.info("Starting create_test_tasks fixture")
+    logger.debug("Starting create_test_tasks fixture")
 
-    user_one = create_test_users[0]
-    user_id = user_one["id"]
-    tasks_to_create = []
-    for i in range(num_tasks):
-        task_data = {
+    user_id = create_test_users[0]["id"]
+    tasks_data = [
+        {
             "title": f"testtask_{i + 1}",
             "body": f"testbody_{i + 1}_for_testtask{i + 1}",
             "status": "New",
             "user": user_id,
         }
-        logger.info(f"Creating task: {task_data}")
-
-        response: Response = await client.post("/tasks", json=task_data)
-        assert response.status_code == 200
-        logger.info(f"Task created successfully, status code: {response.status_code}")
-
-        response_json = response.json()
-        tasks_to_create.append(response_json)
-
-    yield tasks_to_create
-
-    logger.info("Starting cleanup of created tasks")
-
-    for task in tasks_to_create:
-        task_id = task["id"]
-
-        stmt = select(TaskModel).where(TaskModel.id == task_id)
-        result = await async_session.execute(stmt)
-        task_for_delete = result.scalar_one_or_none()
-
-        if task_for_delete is not None:
-            logger.info(f"Deleting task with ID: {task_id}")
-
-            response: Response = await client.delete(
-                f"/tasks/{task_id}",
-            )
-            assert response.status_code == 204
-            assert response.text == ""
+        for i in range(num_tasks)
+    ]
+    result = await async_session.execute(
+        insert(TaskModel).returning(TaskModel.title, TaskModel.id), tasks_data
+    )
+    # Порядок строк RETURNING в многострочном INSERT не гарантирован: ID сопоставляются по названию.
+    task_ids = dict(result.tuples().all())
+    await async_session.commit()
+    logger.debug("Created %s test tasks", len(task_ids))
 
-            logger.info(
-                f"Task with ID {task_id} deleted successfully, status code: {response.status_code}"
-            )
+    yield [
+        {**task_data, "id": task_ids[task_data["title"]]} for task_data in tasks_data
+    ]
 
 
 async def delete_test_task(
@@ -253,7 +275,7 @@ async def delete_test_task(
     :param task_id: ID задачи для удаления.
     :return: Статус код удаления задачи.
     """
-    logger.info(f"Deleting task with ID: {task_id}")
+    logger.info("Deleting task with ID: %s", task_id)
 
     response: Response = await client.delete(
         f"/tasks/{task_id}",
@@ -261,7 +283,9 @@ async def delete_test_task(
     assert response.status_code == 204
     assert response.text == ""
     logger.info(
-        f"Task with ID {task_id} deleted successfully, status code: {response.status_code}"
+        "Task with ID %s deleted successfully, status code: %s",
+        task_id,
+        response.status_code,
     )
 
     return response.status_code
@@ -278,7 +302,7 @@ async def delete_test_user(
     :param user_id: ID пользователя для удаления.
     :return: Статус код удаления пользователя.
     """
-    logger.info(f"Deleting user with ID: {user_id}")
+    logger.info("Deleting user with ID: %s", user_id)
 
     response: Response = await client.delete(
         f"/users/{user_id}",
@@ -286,7 +310,9 @@ async def delete_test_user(
     assert response.status_code == 204
     assert response.text == ""
     logger.info(
-        f"User with ID {user_id} deleted successfully, status code: {response.status_code}"
+        "User with ID %s deleted successfully, status code: %s",
+        user_id,
+        response.status_code,
     )
 
     return response.status_code
@@ -2,7 +2,7 @@
 Набор тест-кейсов для роутера задач (task router).
 """
 
-test_cases_task_router_for_get_task = [
+test_cases_task_router_for_get_task = (
     (
         1,
         200,
@@ -28,9 +28,9 @@ test_cases_task_router_for_get_task = [
         422,
         None,
     ),
-]
+)
 
-test_cases_task_router_for_add_task = [
+test_cases_task_router_for_add_task = (
     (
         {
             "title": "task_for_test",
@@ -47,6 +47,22 @@ test_cases_task_router_for_add_task = [
             "id": 1,
         },
     ),
+    (
+        {
+            "title": "task_for_test",
+            "body": "body for test task",
+            "status": "In_process",
+            "user": 1,
+        },
+        200,
+        {
+            "title": "task_for_test",
+            "body": "body for test task",
+            "status": "In_process",
+            "user": 1,
+            "id": 1,
+        },
+    ),
     (
         {"body": "body for test task", "status": "New", "user": 1},
         422,
@@ -97,9 +113,9 @@ test_cases_task_router_for_add_task = [
         422,
         None,
     ),
-]
+)
 
-test_cases_task_router_for_update_task = [
+test_cases_task_router_for_update_task = (
     (
         0,
         1,
@@ -173,9 +189,9 @@ test_cases_task_router_for_update_task = [
             "user": 1,
         },
     ),
-]
+)
 
-test_cases_task_router_for_delete_task = [
+test_cases_task_router_for_delete_task = (
     (
         0,
         1,
@@ -200,4 +216,4 @@ test_cases_task_router_for_delete_task = [
         422,
         None,
     ),
-]
+)
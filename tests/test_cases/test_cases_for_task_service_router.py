@@ -2,7 +2,7 @@
 Набор параметризованных тест-кейсов для service-роутера задач (service/task-related endpoints).
 """
 
-test_cases_service_task_router_for_get_task = [
+test_cases_service_task_router_for_get_task = (
     (
         0,
         {"token": "00000000"},
@@ -37,9 +37,9 @@ test_cases_service_task_router_for_get_task = [
         401,
         None,
     ),
-]
+)
 
-test_cases_service_task_router_for_get_specific_task = [
+test_cases_service_task_router_for_get_specific_task = (
     (
         0,
         {"token": "00000000"},
@@ -78,9 +78,9 @@ test_cases_service_task_router_for_get_specific_task = [
         401,
         None,
     ),
-]
+)
 
-test_cases_service_task_router_for_create_task = [
+test_cases_service_task_router_for_create_task = (
     (
         1,
         {"token": "00000000"},
@@ -132,9 +132,16 @@ test_cases_service_task_router_for_create_task = [
         422,
         None,
     ),
-]
+    (
+        1,
+        {"token": "00000000"},
+        {"title": "t", "body": "test body for test add", "status": "New", "user": 1},
+        422,
+        None,
+    ),
+)
 
-test_cases_service_task_router_for_update_task = [
+test_cases_service_task_router_for_update_task = (
     (
         1,
         1,
@@ -182,9 +189,9 @@ test_cases_service_task_router_for_update_task = [
         404,
         None,
     ),
-]
+)
 
-test_cases_service_task_router_for_delete_task = [
+test_cases_service_task_router_for_delete_task = (
     (
         1,
         1,
@@ -215,4 +222,4 @@ test_cases_service_task_router_for_delete_task = [
         None,
         None,
     ),
-]
+)
@@ -2,7 +2,7 @@
 Набор параметризованных тест-кейсов для роутера пользователей (user router).
 """
 
-test_cases_user_router_for_get_user = [
+test_cases_user_router_for_get_user = (
     (
         1,
         200,
@@ -27,9 +27,9 @@ test_cases_user_router_for_get_user = [
         422,
         None,
     ),
-]
+)
 
-test_cases_user_router_for_add_user = [
+test_cases_user_router_for_add_user = (
     (
         {"name": "test user", "email": "test@mail.com", "password": "123456789"},
         200,
@@ -70,9 +70,9 @@ test_cases_user_router_for_add_user = [
         422,
         None,
     ),
-]
+)
 
-test_cases_user_router_for_update_user = [
+test_cases_user_router_for_update_user = (
     (
         1,
         {
@@ -123,7 +123,7 @@ test_cases_user_router_for_update_user = [
         {"email": "test@update.com", "password": "987654321"},
         200,
         {
-            "name": "test user update",
+            "name": "testuser_1",
             "email": "test@update.com",
             "password": "987654321",
             "id": 1,
@@ -135,7 +135,7 @@ test_cases_user_router_for_update_user = [
         200,
         {
             "name": "test user update",
-            "email": "test@update.com",
+            "email": "testuser_1@example.com",
             "password": "987654321",
             "id": 1,
         },
@@ -147,7 +147,7 @@ test_cases_user_router_for_update_user = [
         {
             "name": "test user update",
             "email": "test@update.com",
-            "password": "987654321",
+            "password": "1234567891",
             "id": 1,
         },
     ),
@@ -169,9 +169,9 @@ test_cases_user_router_for_update_user = [
         422,
         None,
     ),
-]
+)
 
-test_cases_user_router_for_delete_user = [
+test_cases_user_router_for_delete_user = (
     (
         1,
         204,
@@ -192,4 +192,4 @@ test_cases_user_router_for_delete_user = [
         422,
         None,
     ),
-]
+)
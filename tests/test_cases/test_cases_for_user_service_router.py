@@ -2,7 +2,7 @@
 Параметризованные тест-кейсы для сервисного роутера пользователей (service/user-related endpoints).
 """
 
-test_cases_service_user_router_for_create_new_user = [
+test_cases_service_user_router_for_create_new_user = (
     (
         {"name": "test user", "email": "test@mail.com", "password": "123456789"},
         200,
@@ -28,14 +28,14 @@ test_cases_service_user_router_for_create_new_user = [
         422,
         None,
     ),
-]
+)
 
-test_cases_service_user_router_for_login_user = [
+test_cases_service_user_router_for_login_user = (
     (0, 200, {"token_value": "access_token", "token_type": "Bearer"}),
     (4, 404, None),
-]
+)
 
-test_cases_service_user_router_for_change_user = [
+test_cases_service_user_router_for_change_user = (
     (
         0,
         {"token": "00000000"},
@@ -84,9 +84,9 @@ test_cases_service_user_router_for_change_user = [
         422,
         None,
     ),
-]
+)
 
-test_cases_service_user_router_for_delete_user = [
+test_cases_service_user_router_for_delete_user = (
     (
         0,
         {"token": "00000000"},
@@ -99,4 +99,4 @@ test_cases_service_user_router_for_delete_user = [
         401,
         None,
     ),
-]
+)
@@ -2,17 +2,72 @@
 Утилиты для тестовой (в памяти) базы данных.
 """
 
-from sqlalchemy import text
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from src.task_manager.database_core import Base
+from src.task_manager.database_core import Base, enable_sqlite_foreign_keys
+from src.task_manager.logger_core import logger
 
+# База в памяти существует только внутри процесса, поэтому при параллельном запуске
+# (pytest -n auto) каждый процесс pytest-xdist получает отдельную базу.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 test_engine = create_async_engine(TEST_DATABASE_URL)
+enable_sqlite_foreign_keys(test_engine)
+
+
+# Каждый тест выполняется внутри внешней транзакции; commit() приложения фиксирует
+# только SAVEPOINT. Драйвер sqlite3 сам управляет BEGIN и ломает вложенные транзакции,
+# поэтому BEGIN выдаётся явно из SQLAlchemy (рецепт из документации SQLAlchemy для SQLite).
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(
+    dbapi_connection: object, connection_record: object
+) -> None:
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn: object) -> None:
+    conn.exec_driver_sql("BEGIN")
+
 
 test_session_local = async_sessionmaker(
     bind=test_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
 )
 
+SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@contextmanager
+def count_statements() -> Iterator[list[str]]:
+    """
+    Собирает SQL-выражения, выполненные тестовым движком внутри блока with.
+
+    Используется для проверки, что эндпоинт не выполняет лишних запросов (N+1).
+    Служебные SAVEPOINT-команды тестовой транзакции не учитываются.
+
+    :return: List[str] - Список выполненных SQL-выражений (заполняется по ходу блока).
+    """
+    statements: list[str] = []
+
+    def _collect(
+        conn: object,
+        cursor: object,
+        statement: str,
+        parameters: object,
+        context: object,
+        executemany: bool,
+    ) -> None:
+        if not statement.startswith(SAVEPOINT_STATEMENTS):
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _collect)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _collect)
+
 
 async def create_test_tables() -> None:
     """
@@ -23,7 +78,7 @@ async def create_test_tables() -> None:
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         await conn.execute(text("PRAGMA journal_mode=WAL"))
-        print("Test tables created.")
+        logger.debug("Test tables created.")
 
 
 async def drop_test_tables() -> None:
@@ -34,4 +89,16 @@ async def drop_test_tables() -> None:
     """
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
-        print("Test tables dropped")
+        logger.debug("Test tables dropped")
+
+
+async def dispose_test_engine() -> None:
+    """
+    Закрыть пул соединений тестового движка.
+
+    Движок один на весь прогон тестов, поэтому пул закрывается только в конце сессии.
+
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    await test_engine.dispose()
+    logger.debug("Test engine disposed")
@@ -2,6 +2,8 @@
 Тесты для роутера задач (tasks).
 """
 
+import json
+
 import pytest
 from httpx import AsyncClient, Response
 from sqlalchemy import select
@@ -36,15 +38,15 @@ async def test_get_tasks(
     response: Response = await client.get(
         "/tasks",
     )
-    logger.debug(f"GET /tasks response status code: {response.status_code}")
+    logger.debug("GET /tasks response status code: %s", response.status_code)
 
     assert response.status_code == 200
     tasks_from_api = response.json()
-    logger.debug(f"GET /tasks response data: {tasks_from_api}")
+    logger.debug("GET /tasks response data: %s", tasks_from_api)
 
     assert len(tasks_from_api) == len(create_test_tasks)
 
-    logger.info(f"Found {len(tasks_from_api)} tasks from API")
+    logger.info("Found %s tasks from API", len(tasks_from_api))
 
     for api_task, db_task in zip(tasks_from_api, create_test_tasks):
         assert api_task["id"] == db_task["id"]
@@ -56,6 +58,34 @@ async def test_get_tasks(
     logger.info("test_get_tasks completed successfully")
 
 
+@pytest.mark.asyncio
+async def test_stream_tasks(
+    client: AsyncClient,
+    create_test_tasks: list[dict],
+) -> None:
+    """
+    Проверяет, что GET /tasks/stream отдаёт все задачи в формате NDJSON.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param create_test_tasks: Fixture для создания набора тестовых задач (tasks) через API.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_stream_tasks")
+
+    response: Response = await client.get(
+        "/tasks/stream",
+    )
+    logger.debug("GET /tasks/stream response status code: %s", response.status_code)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    tasks_from_api = [json.loads(line) for line in response.text.splitlines()]
+
+    assert tasks_from_api == create_test_tasks
+
+    logger.info("test_stream_tasks completed successfully")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "task_id, expected_status_code, expected_result",
@@ -81,25 +111,29 @@ async def test_get_task(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_get_task with task_id: {task_id}, expected_status_code: {expected_status_code}"
+        "Starting test_get_task with task_id: %s, expected_status_code: %s",
+        task_id,
+        expected_status_code,
     )
 
     response: Response = await client.get(
         f"/tasks/{task_id}",
     )
-    logger.debug(f"GET /tasks/{task_id} response status code: {response.status_code}")
+    logger.debug(
+        "GET /tasks/%s response status code: %s", task_id, response.status_code
+    )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"GET /tasks/{task_id} response data: {response_data}")
+        logger.debug("GET /tasks/%s response data: %s", task_id, response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
             assert response_data[key] == value
 
-    logger.info(f"test_get_task with task_id: {task_id} completed")
+    logger.info("test_get_task with task_id: %s completed", task_id)
 
 
 @pytest.mark.asyncio
@@ -127,26 +161,29 @@ async def test_add_task(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_add_task with task_data: {task_data}, expected_status_code: {expected_status_code}"
+        "Starting test_add_task with task_data: %s, expected_status_code: %s",
+        task_data,
+        expected_status_code,
     )
 
     if "user" in task_data:
         if task_data["user"] != "user":
             user_id = create_test_users[0]["id"]
-            task_data["user"] = user_id
-            logger.debug(f"Updated task_data['user'] to: {user_id}")
+            # Тест-кейсы общие для всех запусков, поэтому исходный словарь не изменяется.
+            task_data = {**task_data, "user": user_id}
+            logger.debug("Updated task_data['user'] to: %s", user_id)
 
     response: Response = await client.post(
         "/tasks",
         json=task_data,
     )
-    logger.debug(f"POST /tasks response status code: {response.status_code}")
+    logger.debug("POST /tasks response status code: %s", response.status_code)
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"POST /tasks response data: {response_data}")
+        logger.debug("POST /tasks response data: %s", response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -166,7 +203,65 @@ async def test_add_task(
         code_delete = await delete_test_task(client=client, task_id=task_id)
         assert code_delete == 204
 
-        logger.info(f"test_add_task with task_data: {task_data} completed")
+        logger.info("test_add_task with task_data: %s completed", task_data)
+
+
+@pytest.mark.asyncio
+async def test_add_tasks_bulk(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    create_test_users: list[dict],
+) -> None:
+    """
+    Проверяет, что POST /tasks/bulk создаёт все задачи и возвращает их в порядке запроса,
+    а ссылка на несуществующего пользователя даёт 404 без частичной вставки.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
+    :param create_test_users: Fixture для создания набора тестовых пользователей через API.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_add_tasks_bulk")
+
+    tasks_data = [
+        {
+            "title": f"bulk task {i}",
+            "body": f"bulk body {i}",
+            "status": "New",
+            "user": user["id"],
+        }
+        for i, user in enumerate(create_test_users)
+    ]
+
+    response: Response = await client.post("/tasks/bulk", json=tasks_data)
+    logger.debug("POST /tasks/bulk response status code: %s", response.status_code)
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert [
+        {key: task[key] for key in ("title", "body", "status", "user")}
+        for task in response_data
+    ] == tasks_data
+
+    for task in response_data:
+        created_task = await async_session.get(TaskModel, task["id"])
+        assert created_task is not None
+        assert created_task.title == task["title"]
+
+    response = await client.post(
+        "/tasks/bulk",
+        json=[{**tasks_data[0], "title": "bulk task missing user", "user": 11}],
+    )
+    assert response.status_code == 404
+    stmt = select(TaskModel).where(TaskModel.title == "bulk task missing user")
+    result = await async_session.execute(stmt)
+    assert result.scalar_one_or_none() is None
+
+    for task in response_data:
+        code_delete = await delete_test_task(client=client, task_id=task["id"])
+        assert code_delete == 204
+
+    logger.info("test_add_tasks_bulk completed")
 
 
 @pytest.mark.asyncio
@@ -198,24 +293,30 @@ async def test_task_update(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_task_update with task_index: {task_index}, task_id: {task_id}, data: {task_data}, expected_status: {expected_status_code}"
+        "Starting test_task_update with task_index: %s, task_id: %s, data: %s, expected_status: %s",
+        task_index,
+        task_id,
+        task_data,
+        expected_status_code,
     )
 
     task_one = create_test_tasks[task_index]
     if task_id == 1:
         task_id = task_one["id"]
-        logger.debug(f"Using task_id from create_test_tasks: {task_id}")
+        logger.debug("Using task_id from create_test_tasks: %s", task_id)
 
     response: Response = await client.put(
         f"/tasks/{task_id}",
         json=task_data,
     )
-    logger.debug(f"PUT /tasks/{task_id} response status code: {response.status_code}")
+    logger.debug(
+        "PUT /tasks/%s response status code: %s", task_id, response.status_code
+    )
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"PUT /tasks/{task_id} response data: {response_data}")
+        logger.debug("PUT /tasks/%s response data: %s", task_id, response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -227,14 +328,16 @@ async def test_task_update(
         updated_task = result.scalar_one_or_none()
 
         assert updated_task is not None
-        logger.debug(f"Updated task from DB: {updated_task}")
+        logger.debug("Updated task from DB: %s", updated_task)
         assert updated_task.title == expected_result["title"]
         assert updated_task.body == expected_result["body"]
         assert updated_task.status == expected_result["status"]
         assert updated_task.user == expected_result["user"]
 
         logger.info(
-            f"test_task_update with task_index: {task_index}, task_id: {task_id} completed"
+            "test_task_update with task_index: %s, task_id: %s completed",
+            task_index,
+            task_id,
         )
 
 
@@ -265,25 +368,28 @@ async def test_task_delete(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_task_delete with task_index: {task_index}, task_id: {task_id}, expected_status: {expected_status_code}"
+        "Starting test_task_delete with task_index: %s, task_id: %s, expected_status: %s",
+        task_index,
+        task_id,
+        expected_status_code,
     )
 
     task_one = create_test_tasks[task_index]
     if task_id == 1:
         task_id = task_one["id"]
-        logger.debug(f"Using task_id from create_test_tasks: {task_id}")
+        logger.debug("Using task_id from create_test_tasks: %s", task_id)
 
     response: Response = await client.delete(
         f"/tasks/{task_id}",
     )
     logger.debug(
-        f"DELETE /tasks/{task_id} response status code: {response.status_code}"
+        "DELETE /tasks/%s response status code: %s", task_id, response.status_code
     )
     assert response.status_code == expected_status_code
 
     if expected_status_code == 204:
         response_text = response.text
-        logger.debug(f"DELETE /tasks/{task_id} response text: {response_text}")
+        logger.debug("DELETE /tasks/%s response text: %s", task_id, response_text)
 
         assert response_text == expected_result
 
@@ -292,8 +398,33 @@ async def test_task_delete(
         deleted_task = result.scalar_one_or_none()
 
         assert deleted_task is None
-        logger.debug(f"Task with id {task_id} successfully deleted from DB")
+        logger.debug("Task with id %s successfully deleted from DB", task_id)
 
     logger.info(
-        f"test_task_delete with task_index: {task_index}, task_id: {task_id} completed"
+        "test_task_delete with task_index: %s, task_id: %s completed",
+        task_index,
+        task_id,
     )
+
+
+@pytest.mark.asyncio
+async def test_request_id_header(client: AsyncClient) -> None:
+    """
+    Проверяет, что RequestLoggingMiddleware возвращает идентификатор запроса:
+    переданный клиентом X-Request-ID повторяется в ответе, а без него генерируется новый.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_request_id_header")
+
+    response: Response = await client.get("/tasks", headers={"X-Request-ID": "abc123"})
+    assert response.status_code == 200
+    assert response.headers["x-request-id"] == "abc123"
+
+    first = (await client.get("/tasks")).headers["x-request-id"]
+    second = (await client.get("/tasks")).headers["x-request-id"]
+    assert len(first) == 32
+    assert first != second
+
+    logger.info("Finished test_request_id_header")
@@ -2,12 +2,15 @@
 Тесты для роутера пользователей (users).
 """
 
+import json
+
 import pytest
 from httpx import Response, AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.task_manager.models import UserModel
+from src.task_manager.password_core import verify_password
 from src.task_manager.logger_core import logger
 from tests.test_cases import (
     test_cases_user_router_for_get_user,
@@ -32,23 +35,56 @@ async def test_get_users(client: AsyncClient, create_test_users: list[dict]) ->
     response: Response = await client.get(
         "/users",
     )
-    logger.debug(f"GET /users response status code: {response.status_code}")
+    logger.debug("GET /users response status code: %s", response.status_code)
     assert response.status_code == 200
     users_from_api = response.json()
-    logger.debug(f"GET /users response data: {users_from_api}")
+    logger.debug("GET /users response data: %s", users_from_api)
     assert len(users_from_api) == len(create_test_users)
 
-    logger.info(f"Found {len(users_from_api)} users from API")
+    logger.info("Found %s users from API", len(users_from_api))
 
     for api_user, db_user in zip(users_from_api, create_test_users):
         assert api_user["id"] == db_user["id"]
         assert api_user["name"] == db_user["name"]
         assert api_user["email"] == db_user["email"]
-        assert api_user["password"] == db_user["password"]
+        assert "password" not in api_user
 
     logger.info("test_get_users completed successfully")
 
 
+@pytest.mark.asyncio
+async def test_stream_users(
+    client: AsyncClient,
+    create_test_users: list[dict],
+) -> None:
+    """
+    Проверяет, что GET /users/stream отдаёт всех пользователей в формате NDJSON.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param create_test_users: Fixture для создания набора тестовых пользователей через API.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_stream_users")
+
+    response: Response = await client.get(
+        "/users/stream",
+    )
+    logger.debug("GET /users/stream response status code: %s", response.status_code)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    users_from_api = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [user["id"] for user in users_from_api] == [
+        user["id"] for user in create_test_users
+    ]
+    assert [user["name"] for user in users_from_api] == [
+        user["name"] for user in create_test_users
+    ]
+
+    logger.info("test_stream_users completed successfully")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "user_id, expected_status_code, expected_result",
@@ -74,35 +110,41 @@ async def test_get_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_get_user with user_id: {user_id}, expected_status_code: {expected_status_code}"
+        "Starting test_get_user with user_id: %s, expected_status_code: %s",
+        user_id,
+        expected_status_code,
     )
 
     response: Response = await client.get(
         f"/users/{user_id}",
     )
-    logger.debug(f"GET /users/{user_id} response status code: {response.status_code}")
+    logger.debug(
+        "GET /users/%s response status code: %s", user_id, response.status_code
+    )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"GET /users/{user_id} response data: {response_data}")
+        logger.debug("GET /users/%s response data: %s", user_id, response_data)
 
         for key, value in expected_result.items():
-            assert key in response_data
-            assert response_data[key] == value
+            if key == "password":
+                assert key not in response_data
+            else:
+                assert response_data[key] == value
 
         stmt = select(UserModel).where(UserModel.id == user_id)
         result = await async_session.execute(stmt)
         read_user = result.scalar_one_or_none()
 
         assert read_user is not None
-        logger.debug(f"User from DB: {read_user}")
+        logger.debug("User from DB: %s", read_user)
         assert read_user.name == expected_result["name"]
         assert read_user.email == expected_result["email"]
-        assert read_user.password == expected_result["password"]
+        assert verify_password(expected_result["password"], read_user.password)
 
-    logger.info(f"test_get_user with user_id: {user_id} completed")
+    logger.info("test_get_user with user_id: %s completed", user_id)
 
 
 @pytest.mark.asyncio
@@ -128,7 +170,9 @@ async def test_add_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_add_user with user_data: {user_data}, expected_status_code: {expected_status_code}"
+        "Starting test_add_user with user_data: %s, expected_status_code: %s",
+        user_data,
+        expected_status_code,
     )
 
     response: Response = await client.post(
@@ -136,18 +180,20 @@ async def test_add_user(
         json=user_data,
     )
     logger.info(
-        f"POST /users request completed with status code: {response.status_code}"
+        "POST /users request completed with status code: %s", response.status_code
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
-            assert key in response_data
-            assert response_data[key] == value
+            if key == "password":
+                assert key not in response_data
+            else:
+                assert response_data[key] == value
 
         user_id = expected_result["id"]
         stmt = select(UserModel).where(UserModel.id == user_id)
@@ -155,11 +201,11 @@ async def test_add_user(
         created_user = result.scalar_one_or_none()
 
         assert created_user is not None
-        logger.info(f"User created successfully with ID: {user_id}")
+        logger.info("User created successfully with ID: %s", user_id)
 
         assert created_user.name == expected_result["name"]
         assert created_user.email == expected_result["email"]
-        assert created_user.password == expected_result["password"]
+        assert verify_password(expected_result["password"], created_user.password)
 
 
 @pytest.mark.asyncio
@@ -189,7 +235,10 @@ async def test_update_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_update_user with user_id: {user_id}, user_data: {user_data}, expected_status_code: {expected_status_code}"
+        "Starting test_update_user with user_id: %s, user_data: %s, expected_status_code: %s",
+        user_id,
+        user_data,
+        expected_status_code,
     )
 
     response: Response = await client.put(
@@ -197,18 +246,22 @@ async def test_update_user(
         json=user_data,
     )
     logger.info(
-        f"PUT /users/{user_id} request completed with status code: {response.status_code}"
+        "PUT /users/%s request completed with status code: %s",
+        user_id,
+        response.status_code,
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
-            assert key in response_data
-            assert response_data[key] == value
+            if key == "password":
+                assert key not in response_data
+            else:
+                assert response_data[key] == value
 
         user_id = expected_result["id"]
         stmt = select(UserModel).where(UserModel.id == user_id)
@@ -216,10 +269,10 @@ async def test_update_user(
         updated_task = result.scalar_one_or_none()
 
         assert updated_task is not None
-        logger.info(f"User updated successfully with ID: {user_id}")
+        logger.info("User updated successfully with ID: %s", user_id)
         assert updated_task.name == expected_result["name"]
         assert updated_task.email == expected_result["email"]
-        assert updated_task.password == expected_result["password"]
+        assert verify_password(expected_result["password"], updated_task.password)
 
 
 @pytest.mark.asyncio
@@ -247,21 +300,25 @@ async def test_delete_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_delete_user with user_id: {user_id}, expected status code: {expected_status_code}"
+        "Starting test_delete_user with user_id: %s, expected status code: %s",
+        user_id,
+        expected_status_code,
     )
 
     response: Response = await client.delete(
         f"/users/{user_id}",
     )
     logger.info(
-        f"DELETE /users/{user_id} request completed with status code: {response.status_code}"
+        "DELETE /users/%s request completed with status code: %s",
+        user_id,
+        response.status_code,
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_text = response.text
-        logger.debug(f"Response text: {response_text}")
+        logger.debug("Response text: %s", response_text)
 
         assert response_text == expected_result
 
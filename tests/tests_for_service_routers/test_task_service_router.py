@@ -2,14 +2,25 @@
 Тесты для сервисного роутера задач (service).
 """
 
+from collections.abc import AsyncIterator
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+import orjson
 import pytest
 from httpx import AsyncClient, Response
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.task_manager.models import TaskModel
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.task_manager.cache_core import get_cache, user_task_key, user_tasks_key
+from src.task_manager.database_core import Base, get_db
+from src.task_manager.main import app
+from src.task_manager.models import TaskModel, UserModel
 from src.task_manager.logger_core import logger
+from src.task_manager.security import encode_jwt, get_token
 from tests.conftest import delete_test_task
+from tests.test_database import count_statements
 from tests.test_cases import (
     test_cases_service_task_router_for_get_task,
     test_cases_service_task_router_for_get_specific_task,
@@ -47,7 +58,9 @@ async def test_get_all_tasks(
     :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_get_all_tasks with task_case: {task_case}, expected_status_code: {expected_status_code}"
+        "Starting test_get_all_tasks with task_case: %s, expected_status_code: %s",
+        task_case,
+        expected_status_code,
     )
 
     if task_case == 0:
@@ -59,14 +72,15 @@ async def test_get_all_tasks(
         headers=headers,
     )
     logger.info(
-        f"GET /service/get_all_tasks request completed with status code: {response.status_code}"
+        "GET /service/get_all_tasks request completed with status code: %s",
+        response.status_code,
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
         assert isinstance(response_data, list)
         assert len(response_data) == len(expected_result)
         for i, exp in enumerate(expected_result):
@@ -80,6 +94,507 @@ async def test_get_all_tasks(
     logger.info("Finished test_get_all_tasks")
 
 
+@pytest.mark.asyncio
+async def test_get_all_tasks_without_tasks(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+) -> None:
+    """
+    Проверяет, что GET /service/get_all_tasks возвращает пустой список
+    для существующего пользователя без задач.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_all_tasks_without_tasks")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    response: Response = await client.get(
+        "/service/get_all_tasks",
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+    logger.info("Finished test_get_all_tasks_without_tasks")
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_single_query(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+    create_test_tasks: list[dict],
+) -> None:
+    """
+    Проверяет, что GET /service/get_all_tasks выполняет один SQL-запрос
+    независимо от количества задач (нет ленивых догрузок N+1).
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :param create_test_tasks: Fixture для создания набора тестовых задач (tasks) через API.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_all_tasks_single_query")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    with count_statements() as statements:
+        response: Response = await client.get(
+            "/service/get_all_tasks",
+            headers=headers,
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()) > 1
+    assert len(statements) == 1
+
+    logger.info("Finished test_get_all_tasks_single_query")
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_not_modified(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+    create_test_tasks: list[dict],
+) -> None:
+    """
+    Проверяет, что GET /service/get_all_tasks отдаёт ETag и отвечает 304 без тела
+    на повторный запрос с совпадающим If-None-Match.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :param create_test_tasks: Fixture для создания набора тестовых задач (tasks) через API.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_all_tasks_not_modified")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    response: Response = await client.get("/service/get_all_tasks", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        "/service/get_all_tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get(
+        "/service/get_all_tasks", headers={**headers, "If-None-Match": '"stale"'}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == len(
+        [
+            task
+            for task in create_test_tasks
+            if task["user"] == get_user_and_jwt["user"]["id"]
+        ]
+    )
+
+    logger.info("Finished test_get_all_tasks_not_modified")
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_stream(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+    create_test_tasks: list[dict],
+) -> None:
+    """
+    Проверяет, что GET /service/get_all_tasks_stream отдаёт задачи пользователя
+    в формате NDJSON (по одной задаче на строку).
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :param create_test_tasks: Fixture для создания набора тестовых задач (tasks) через API.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_all_tasks_stream")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    response: Response = await client.get(
+        "/service/get_all_tasks_stream", headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    streamed = [orjson.loads(line) for line in response.content.splitlines()]
+    expected = [
+        task
+        for task in create_test_tasks
+        if task["user"] == get_user_and_jwt["user"]["id"]
+    ]
+    assert streamed == expected
+
+    logger.info("Finished test_get_all_tasks_stream")
+
+
+@pytest.mark.asyncio
+async def test_current_user_deleted_elsewhere(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    get_user_and_jwt: dict,
+) -> None:
+    """
+    Проверяет, что get_current_user не кэширует пользователя между запросами:
+    после удаления учётной записи в обход роутера (например, другим процессом
+    приложения) следующий запрос с ещё действующим токеном получает 404 User not found.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_current_user_deleted_elsewhere")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    response: Response = await client.get(
+        "/service/get_all_tasks_stream", headers=headers
+    )
+    assert response.status_code == 200
+
+    await async_session.execute(
+        delete(UserModel).where(UserModel.id == get_user_and_jwt["user"]["id"])
+    )
+    async_session.expunge_all()
+
+    response = await client.get("/service/get_all_tasks_stream", headers=headers)
+    assert response.status_code == 404
+    assert response.json() == {"detail": "User not found"}
+
+    logger.info("Finished test_current_user_deleted_elsewhere")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url, params",
+    (
+        ("/service/get_all_tasks", {}),
+        ("/service/get_specific_task", {"task_id": 1}),
+        ("/service/task/1", {}),
+    ),
+)
+async def test_service_reads_for_deleted_user(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    get_user_and_jwt: dict,
+    url: str,
+    params: dict,
+) -> None:
+    """
+    Проверяет, что чтение задач с действующим токеном удалённого пользователя возвращает
+    404 User not found, как и остальные эндпоинты /service.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :param url: Проверяемый эндпоинт.
+    :param params: Query-параметры запроса.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_service_reads_for_deleted_user: %s", url)
+
+    await async_session.execute(
+        delete(UserModel).where(UserModel.id == get_user_and_jwt["user"]["id"])
+    )
+    async_session.expunge_all()
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    response: Response = await client.get(url, params=params, headers=headers)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "User not found"}
+
+    logger.info("Finished test_service_reads_for_deleted_user")
+
+
+@pytest.fixture(scope="function")
+async def queue_pool_sessionmaker(
+    tmp_path: Path,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """
+    Fixture с файловой SQLite-базой за пулом AsyncAdaptedQueuePool.
+
+    Общая тестовая база использует одно соединение, поэтому get_task_with_user_check
+    выполняет запросы последовательно. Здесь пул выдаёт разные соединения, и
+    проверка пользователя идёт параллельно с поиском задачи, как в PostgreSQL.
+
+    :param tmp_path: Временный каталог pytest для файла базы данных.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'queue_pool.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(UserModel),
+            [{"name": "pool_user", "email": "pool@example.com", "password": "x"}],
+        )
+        await conn.execute(
+            insert(TaskModel),
+            [{"title": "pool task", "body": "pool body", "status": "New", "user": 1}],
+        )
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "user_id, task_id, expected_status_code, expected_result",
+    (
+        (1, 1, 200, {"id": 1, "title": "pool task", "user": 1}),
+        (1, 2, 404, {"detail": "Task not found"}),
+        (2, 1, 404, {"detail": "User not found"}),
+    ),
+)
+async def test_get_specific_task_concurrent_user_check(
+    app_client: AsyncClient,
+    queue_pool_sessionmaker: async_sessionmaker[AsyncSession],
+    user_id: int,
+    task_id: int,
+    expected_status_code: int,
+    expected_result: dict,
+) -> None:
+    """
+    Проверяет ветку get_task_with_user_check, в которой пользователь и задача ищутся
+    одновременно на двух соединениях пула: найденная задача, отсутствующая задача
+    и отсутствующий пользователь.
+
+    :param app_client: Fixture, создающая один AsyncClient на весь прогон тестов.
+    :param queue_pool_sessionmaker: Fixture с файловой SQLite-базой за пулом соединений.
+    :param user_id: ID пользователя в токене.
+    :param task_id: ID запрашиваемой задачи.
+    :param expected_status_code: Ожидаемый статус код теста.
+    :param expected_result: Ожидаемые поля ответа.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info(
+        "Starting test_get_specific_task_concurrent_user_check: user %s, task %s",
+        user_id,
+        task_id,
+    )
+
+    async def override_get_db() -> AsyncIterator[AsyncSession]:
+        async with queue_pool_sessionmaker() as session:
+            yield session
+
+    sync_engine = queue_pool_sessionmaker.kw["bind"].sync_engine
+    checked_out = 0
+    max_checked_out = 0
+
+    def on_checkout(*args: object) -> None:
+        nonlocal checked_out, max_checked_out
+        checked_out += 1
+        max_checked_out = max(max_checked_out, checked_out)
+
+    def on_checkin(*args: object) -> None:
+        nonlocal checked_out
+        checked_out -= 1
+
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "checkin", on_checkin)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        token = encode_jwt(payload={"sub": str(user_id), "username": "pool_user"})
+        response: Response = await app_client.get(
+            f"/service/task/{task_id}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+        event.remove(sync_engine, "checkout", on_checkout)
+        event.remove(sync_engine, "checkin", on_checkin)
+
+    assert response.status_code == expected_status_code
+    response_data = response.json()
+    for key, value in expected_result.items():
+        assert response_data[key] == value
+    assert max_checked_out == 2
+
+    logger.info("Finished test_get_specific_task_concurrent_user_check")
+
+
+@pytest.mark.asyncio
+async def test_cached_token_payload_is_read_only(get_user_and_jwt: dict) -> None:
+    """
+    Проверяет, что get_token отдаёт закэшированный payload только для чтения:
+    изменение payload в обработчике не может испортить запись кэша.
+
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_cached_token_payload_is_read_only")
+
+    payload = await get_token(get_user_and_jwt["token"])
+    with pytest.raises(TypeError):
+        payload["uid"] = 0
+
+    cached = await get_token(get_user_and_jwt["token"])
+    assert cached["uid"] == get_user_and_jwt["user"]["id"]
+
+    logger.info("Finished test_cached_token_payload_is_read_only")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sub", ["abc", "", "-1"])
+async def test_get_all_tasks_invalid_sub(client: AsyncClient, sub: str) -> None:
+    """
+    Проверяет, что подписанный токен с нечисловым claim "sub" отклоняется со статусом 401.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param sub: Значение claim "sub" в токене.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_all_tasks_invalid_sub with sub: %s", sub)
+
+    token = encode_jwt(payload={"sub": sub})
+    response: Response = await client.get(
+        "/service/get_all_tasks", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 401
+
+    logger.info("Finished test_get_all_tasks_invalid_sub")
+
+
+class FakeCache:
+    """
+    Минимальная замена клиента Redis на словаре для проверки кэширования в тестах.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match: str) -> AsyncIterator[str]:
+        for key in list(self.data):
+            if fnmatchcase(key, match):
+                yield key
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_cache_invalidation(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+) -> None:
+    """
+    Проверяет, что GET /service/get_all_tasks кэширует ответ, а создание и удаление
+    задачи через сервис сбрасывают кэш пользователя.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_all_tasks_cache_invalidation")
+
+    cache = FakeCache()
+    app.dependency_overrides[get_cache] = lambda: cache
+    user_id = get_user_and_jwt["user"]["id"]
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+
+    response: Response = await client.get("/service/get_all_tasks", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == []
+    assert cache.data[user_tasks_key(user_id)] == b"[]"
+
+    response = await client.post(
+        "/service/create_task",
+        data={"title": "cached", "body": "cached body", "status": "New"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    task_id = response.json()["id"]
+    assert user_tasks_key(user_id) not in cache.data
+
+    response = await client.get("/service/get_all_tasks", headers=headers)
+    assert [task["id"] for task in response.json()] == [task_id]
+
+    response = await client.delete(
+        "/service/delete_task", params={"task_id": task_id}, headers=headers
+    )
+    assert response.status_code == 204
+    assert user_tasks_key(user_id) not in cache.data
+
+    response = await client.get("/service/get_all_tasks", headers=headers)
+    assert response.json() == []
+
+    logger.info("Finished test_get_all_tasks_cache_invalidation")
+
+
+@pytest.mark.asyncio
+async def test_task_cache_invalidated_by_admin_routes(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+    create_test_tasks: list[dict],
+) -> None:
+    """
+    Проверяет, что изменение и удаление задачи через /tasks и удаление пользователя
+    через /users сбрасывают закэшированные задачи этого пользователя.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :param create_test_tasks: Fixture для создания набора тестовых задач (tasks) через API.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_task_cache_invalidated_by_admin_routes")
+
+    cache = FakeCache()
+    app.dependency_overrides[get_cache] = lambda: cache
+    user_id = get_user_and_jwt["user"]["id"]
+    task_id = create_test_tasks[0]["id"]
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+
+    async def fill_cache() -> None:
+        response = await client.get("/service/get_all_tasks", headers=headers)
+        assert response.status_code == 200
+        response = await client.get(
+            "/service/get_specific_task", params={"task_id": task_id}, headers=headers
+        )
+        assert response.status_code == 200
+        assert user_tasks_key(user_id) in cache.data
+        assert user_task_key(user_id, task_id) in cache.data
+
+    await fill_cache()
+    response: Response = await client.put(
+        f"/tasks/{task_id}",
+        json={"title": "admin update", "status": "Finished"},
+    )
+    assert response.status_code == 200
+    assert user_tasks_key(user_id) not in cache.data
+    assert user_task_key(user_id, task_id) not in cache.data
+
+    await fill_cache()
+    response = await client.delete(f"/tasks/{task_id}")
+    assert response.status_code == 204
+    assert user_tasks_key(user_id) not in cache.data
+    assert user_task_key(user_id, task_id) not in cache.data
+
+    task_id = create_test_tasks[1]["id"]
+    await fill_cache()
+    response = await client.delete(f"/users/{user_id}")
+    assert response.status_code == 204
+    assert cache.data == {}
+
+    logger.info("Finished test_task_cache_invalidated_by_admin_routes")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "task_case, token, task_id, task_title, expected_status_code, expected_result",
@@ -111,7 +626,10 @@ async def test_get_specific_task(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_get_specific_task with task_case: {task_case}, task_id: {task_id}, expected_status_code: {expected_status_code}"
+        "Starting test_get_specific_task with task_case: %s, task_id: %s, expected_status_code: %s",
+        task_case,
+        task_id,
+        expected_status_code,
     )
 
     if task_case == 0:
@@ -123,14 +641,15 @@ async def test_get_specific_task(
         "/service/get_specific_task", params=data, headers=headers
     )
     logger.info(
-        f"GET /service/get_specific_task request completed with status code: {response.status_code}"
+        "GET /service/get_specific_task request completed with status code: %s",
+        response.status_code,
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -145,14 +664,15 @@ async def test_get_specific_task(
         "/service/get_specific_task", params=data, headers=headers
     )
     logger.info(
-        f"GET /service/get_specific_task request completed with status code: {response.status_code}"
+        "GET /service/get_specific_task request completed with status code: %s",
+        response.status_code,
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -161,6 +681,71 @@ async def test_get_specific_task(
     logger.info("Finished test_get_specific_task")
 
 
+@pytest.mark.asyncio
+async def test_get_specific_task_invalid_id(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+) -> None:
+    """
+    Проверяет, что /service/get_specific_task с нечисловым task_id возвращает 422.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_specific_task_invalid_id")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    response: Response = await client.get(
+        "/service/get_specific_task", params={"task_id": "abc"}, headers=headers
+    )
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "task_id must be an integer"}
+
+    logger.info("Finished test_get_specific_task_invalid_id")
+
+
+@pytest.mark.asyncio
+async def test_get_task_by_id_and_title_routes(
+    client: AsyncClient,
+    get_user_and_jwt: dict,
+    create_test_tasks: list[dict],
+) -> None:
+    """
+    Проверяет маршруты GET /service/task/{task_id} и /service/task/by-title/{task_title}:
+    задача пользователя возвращается, несуществующая задача — 404.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :param create_test_tasks: Fixture для создания набора тестовых задач (tasks) через API.
+    :return:  Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_get_task_by_id_and_title_routes")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    user_id = get_user_and_jwt["user"]["id"]
+    own_task = next(task for task in create_test_tasks if task["user"] == user_id)
+    missing_task_id = max(task["id"] for task in create_test_tasks) + 1
+
+    response: Response = await client.get(
+        f"/service/task/{own_task['id']}", headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json() == own_task
+
+    response = await client.get(
+        f"/service/task/by-title/{own_task['title']}", headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json() == own_task
+
+    response = await client.get(f"/service/task/{missing_task_id}", headers=headers)
+    assert response.status_code == 404
+
+    logger.info("Finished test_get_task_by_id_and_title_routes")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "task_case, token, task_data, expected_status_code, expected_result",
@@ -190,26 +775,29 @@ async def test_create_task(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_create_task with task_case: {task_case}, expected_status_code: {expected_status_code}"
+        "Starting test_create_task with task_case: %s, expected_status_code: %s",
+        task_case,
+        expected_status_code,
     )
 
     if task_case == 1:
         token = get_user_and_jwt["token"]
 
     headers = {"Authorization": f"Bearer {token}"}
-    logger.debug(f"Task data: {task_data}")
+    logger.debug("Task data: %s", task_data)
 
     response: Response = await client.post(
         "/service/create_task", data=task_data, headers=headers
     )
     logger.info(
-        f"POST /service/create_task request completed with status code: {response.status_code}"
+        "POST /service/create_task request completed with status code: %s",
+        response.status_code,
     )
     assert response.status_code == expected_status_code
 
     if response.status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -228,7 +816,7 @@ async def test_create_task(
 
         code_delete = await delete_test_task(client=client, task_id=task_id)
         logger.info(
-            f"DELETE task with id {task_id} returned status code: {code_delete}"
+            "DELETE task with id %s returned status code: %s", task_id, code_delete
         )
 
         assert code_delete == 204
@@ -273,7 +861,10 @@ async def test_update_task(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info(
-        f"Starting test_update_task with task_case: {task_case}, task_case_2: {task_case_2}, expected_status_code: {expected_status_code}"
+        "Starting test_update_task with task_case: %s, task_case_2: %s, expected_status_code: %s",
+        task_case,
+        task_case_2,
+        expected_status_code,
     )
 
     if task_case == 1:
@@ -281,7 +872,7 @@ async def test_update_task(
 
     if task_case_2 == 1:
         task_id = create_test_tasks[0]["id"]
-        logger.info(f"Updating task by ID: {task_id}")
+        logger.info("Updating task by ID: %s", task_id)
 
     headers = {"Authorization": f"Bearer {token}"}
     params = {
@@ -291,14 +882,15 @@ async def test_update_task(
         "/service/update_task", json=task_data, params=params, headers=headers
     )
     logger.info(
-        f"PUT /service/update_task request completed with status code: {response.status_code}"
+        "PUT /service/update_task request completed with status code: %s",
+        response.status_code,
     )
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -319,14 +911,15 @@ async def test_update_task(
 
     if task_case_2 == 1:
         task_title = create_test_tasks[1]["title"]
-        logger.info(f"Updating task by title: {task_title}")
+        logger.info("Updating task by title: %s", task_title)
 
     headers = {"Authorization": f"Bearer {token}"}
     params = {
         "task_title": task_title,
     }
     logger.info(
-        f"PUT /service/update_task request completed with status code: {response.status_code}"
+        "PUT /service/update_task request completed with status code: %s",
+        response.status_code,
     )
 
     response: Response = await client.put(
@@ -336,7 +929,7 @@ async def test_update_task(
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
             assert key in response_data
@@ -393,7 +986,7 @@ async def test_delete_task(
     :param expected_result_2: Ожидаемый результат теста при удалении по названию задачи.
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
-    logger.info(f"Test case: task_case={task_case}, task_case_2={task_case_2}")
+    logger.info("Test case: task_case=%s, task_case_2=%s", task_case, task_case_2)
 
     if task_case == 1:
         token = get_user_and_jwt["token"]
@@ -401,14 +994,16 @@ async def test_delete_task(
 
     if task_case_2 == 1:
         task_id = create_test_tasks[0]["id"]
-        logger.debug(f"Using task ID from create_test_tasks: {task_id}")
+        logger.debug("Using task ID from create_test_tasks: %s", task_id)
 
     headers = {"Authorization": f"Bearer {token}"}
     params = {
         "task_id": task_id,
     }
     logger.debug(
-        f"Sending DELETE request to /service/delete_task with params: {params} and headers: {headers}"
+        "Sending DELETE request to /service/delete_task with params: %s and headers: %s",
+        params,
+        headers,
     )
 
     response: Response = await client.delete(
@@ -417,7 +1012,7 @@ async def test_delete_task(
         headers=headers,
     )
     logger.info(
-        f"Status code assertion: {response.status_code} == {expected_status_code}"
+        "Status code assertion: %s == %s", response.status_code, expected_status_code
     )
 
     assert response.status_code == expected_status_code
@@ -427,7 +1022,8 @@ async def test_delete_task(
 
         assert "" in response_text
         logger.info(
-            f"Response body assertion: Expected empty response, received: '{response.text}'"
+            "Response body assertion: Expected empty response, received: '%s'",
+            response.text,
         )
 
         assert response_text == expected_result
@@ -436,25 +1032,27 @@ async def test_delete_task(
         result = await async_session.execute(stmt)
         deleted_task = result.scalar_one_or_none()
         logger.info(
-            f"Checking if task with ID {task_id} was deleted from the database."
+            "Checking if task with ID %s was deleted from the database.", task_id
         )
 
         assert deleted_task is None
-        logger.info(f"Task with ID {task_id} successfully deleted from the database.")
+        logger.info("Task with ID %s successfully deleted from the database.", task_id)
 
     if task_case == 1:
         token = get_user_and_jwt["token"]
 
     if task_case_2 == 1:
         task_title = create_test_tasks[1]["title"]
-        logger.debug(f"Using task title from create_test_tasks: {task_title}")
+        logger.debug("Using task title from create_test_tasks: %s", task_title)
 
     headers = {"Authorization": f"Bearer {token}"}
     params = {
         "task_title": task_title,
     }
     logger.debug(
-        f"Sending DELETE request to /service/delete_task with params: {params} and headers: {headers}"
+        "Sending DELETE request to /service/delete_task with params: %s and headers: %s",
+        params,
+        headers,
     )
 
     response: Response = await client.delete(
@@ -463,7 +1061,7 @@ async def test_delete_task(
         headers=headers,
     )
     logger.info(
-        f"Status code assertion: {response.status_code} == {expected_status_code}"
+        "Status code assertion: %s == %s", response.status_code, expected_status_code
     )
 
     assert response.status_code == expected_status_code
@@ -471,7 +1069,8 @@ async def test_delete_task(
     if expected_status_code == 204:
         response_text = response.text
         logger.info(
-            f"Response body assertion: Expected empty response, received: '{response.text}'"
+            "Response body assertion: Expected empty response, received: '%s'",
+            response.text,
         )
 
         assert "" in response_text
@@ -482,8 +1081,65 @@ async def test_delete_task(
         result = await async_session.execute(stmt)
         deleted_task = result.scalar_one_or_none()
         logger.info(
-            f"Checking if task with ID {task_id} was deleted from the database."
+            "Checking if task with ID %s was deleted from the database.", task_id
         )
 
         assert deleted_task is None
-        logger.info(f"Task with ID {task_id} successfully deleted from the database.")
+        logger.info("Task with ID %s successfully deleted from the database.", task_id)
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_task_with_duplicate_title(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    get_user_and_jwt: dict,
+) -> None:
+    """
+    Проверяет, что изменение и удаление по неуникальному названию затрагивают только
+    одну задачу пользователя (с наименьшим ID), а остальные задачи остаются без изменений.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
+    :param get_user_and_jwt: Fixture для получения первого созданного пользователя и JWT-токена аутентификации.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_update_and_delete_task_with_duplicate_title")
+
+    headers = {"Authorization": f"Bearer {get_user_and_jwt['token']}"}
+    task_ids = []
+    for body in ("body of the first task", "body of the second task"):
+        response: Response = await client.post(
+            "/service/create_task",
+            data={"title": "dup", "body": body, "status": "New"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        task_ids.append(response.json()["id"])
+
+    response = await client.put(
+        "/service/update_task",
+        json={"body": "updated body of the task", "status": "Finished"},
+        params={"task_title": "dup"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["id"] == task_ids[0]
+
+    stmt = select(TaskModel.id, TaskModel.body).where(TaskModel.id.in_(task_ids))
+    result = await async_session.execute(stmt.order_by(TaskModel.id))
+    assert result.all() == [
+        (task_ids[0], "updated body of the task"),
+        (task_ids[1], "body of the second task"),
+    ]
+
+    response = await client.delete(
+        "/service/delete_task", params={"task_title": "dup"}, headers=headers
+    )
+    assert response.status_code == 204
+
+    result = await async_session.execute(
+        select(TaskModel.id).where(TaskModel.id.in_(task_ids))
+    )
+    assert result.scalars().all() == [task_ids[1]]
+
+    logger.info("Finished test_update_and_delete_task_with_duplicate_title")
@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.task_manager.models import UserModel
+from src.task_manager.password_core import verify_password
 from src.task_manager.logger_core import logger
 from tests.conftest import delete_test_user
 from tests.test_cases import (
@@ -41,41 +42,43 @@ async def test_create_new_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info("Sending POST request to /service_user/create_user")
-    logger.debug(f"Request data: {user_data}")
+    logger.debug("Request data: %s", user_data)
 
     response: Response = await client.post("/service_user/create_user", data=user_data)
 
-    logger.info(f"Received response with status code: {response.status_code}")
+    logger.info("Received response with status code: %s", response.status_code)
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         for key, value in expected_result.items():
-            assert key in response_data
-            assert response_data[key] == value
+            if key == "password":
+                assert key not in response_data
+            else:
+                assert response_data[key] == value
 
         user_id = expected_result["id"]
         stmt = select(UserModel).where(UserModel.id == user_id)
         result = await async_session.execute(stmt)
         created_user = result.scalar_one_or_none()
 
-        logger.info(f"Checking if user with ID {user_id} was created in the database.")
+        logger.info("Checking if user with ID %s was created in the database.", user_id)
 
         assert created_user is not None
         assert created_user.name == expected_result["name"]
         assert created_user.email == expected_result["email"]
-        assert created_user.password == expected_result["password"]
+        assert verify_password(expected_result["password"], created_user.password)
 
-        logger.info(f"Deleting test user with ID: {user_id}")
+        logger.info("Deleting test user with ID: %s", user_id)
 
         code_delete = await delete_test_user(
             client=client,
             user_id=user_id,
         )
-        logger.info(f"User deletion returned status code: {code_delete}")
+        logger.info("User deletion returned status code: %s", code_delete)
 
         assert code_delete == 204
 
@@ -104,17 +107,19 @@ async def test_login_for_create_task(
     :param expected_result: Ожидаемый результат теста.
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
-    logger.info(f"Created {len(create_test_users)} test users.")
-    logger.debug(f"Test users created: {create_test_users}")
+    logger.info("Created %s test users.", len(create_test_users))
+    logger.debug("Test users created: %s", create_test_users)
     logger.info(
-        f"Test case: user_index={user_index}, expected_status_code={expected_status_code}"
+        "Test case: user_index=%s, expected_status_code=%s",
+        user_index,
+        expected_status_code,
     )
-    logger.info(f"Expected result: {expected_result}")
+    logger.info("Expected result: %s", expected_result)
 
     user_data = {"username": "unknown user", "password": "987654321"}
     if user_index == 0:
         logger.debug(
-            f"Using user data from create_test_users[0]: {create_test_users[0]}"
+            "Using user data from create_test_users[0]: %s", create_test_users[0]
         )
 
         user_one = create_test_users[user_index]
@@ -125,23 +130,68 @@ async def test_login_for_create_task(
         "/service_user/login",
         data=user_data,
     )
-    logger.info(f"Received response with status code: {response.status_code}")
+    logger.info("Received response with status code: %s", response.status_code)
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         assert expected_result["token_value"] in response_data
         logger.info(
-            f"Checking for token type: {expected_result['token_type']} in response."
+            "Checking for token type: %s in response.", expected_result["token_type"]
         )
 
         assert "token_type" in response_data
         assert response_data["token_type"] == expected_result["token_type"]
 
 
+@pytest.mark.asyncio
+async def test_login_rehashes_legacy_password(
+    client: AsyncClient,
+    async_session: AsyncSession,
+) -> None:
+    """
+    Проверяет вход пользователя, пароль которого хранится в открытом виде (учётная
+    запись создана до перехода на хеширование): вход успешен, а пароль в базе данных
+    заменяется хешем.
+
+    :param client: Fixture, создающая TestClient с переопределенной зависимостью get_db.
+    :param async_session: Fixture, предоставляющая асинхронную SQLAlchemy-сессию для теста.
+    :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
+    """
+    logger.info("Starting test_login_rehashes_legacy_password")
+
+    legacy_user = UserModel(
+        name="legacy_user", email="legacy@example.com", password="legacy_password"
+    )
+    async_session.add(legacy_user)
+    await async_session.flush()
+
+    response: Response = await client.post(
+        "/service_user/login",
+        data={"username": "legacy_user", "password": "wrong_password"},
+    )
+    assert response.status_code == 404
+
+    response = await client.post(
+        "/service_user/login",
+        data={"username": "legacy_user", "password": "legacy_password"},
+    )
+    assert response.status_code == 200
+
+    result = await async_session.execute(
+        select(UserModel.password).where(UserModel.id == legacy_user.id)
+    )
+    stored_password = result.scalar_one()
+
+    assert stored_password != "legacy_password"
+    assert verify_password("legacy_password", stored_password)
+
+    logger.info("Finished test_login_rehashes_legacy_password")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "user_case, token, user_update_data, expected_status_code, expected_result",
@@ -171,11 +221,11 @@ async def test_change_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info("Using user and JWT from get_user_and_jwt fixture.")
-    logger.info(f"Test case: user_case={user_case}")
-    logger.debug(f"Token: {token}")
-    logger.debug(f"User update data: {user_update_data}")
-    logger.info(f"Expected status code: {expected_status_code}")
-    logger.info(f"Expected result: {expected_result}")
+    logger.info("Test case: user_case=%s", user_case)
+    logger.debug("Token: %s", token)
+    logger.debug("User update data: %s", user_update_data)
+    logger.info("Expected status code: %s", expected_status_code)
+    logger.info("Expected result: %s", expected_result)
 
     if user_case == 0:
         token = get_user_and_jwt["token"]
@@ -189,29 +239,31 @@ async def test_change_user(
         headers=headers,
         data=user_update_data,
     )
-    logger.info(f"Received response with status code: {response.status_code}")
+    logger.info("Received response with status code: %s", response.status_code)
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 200:
         response_data = response.json()
-        logger.debug(f"Response data: {response_data}")
+        logger.debug("Response data: %s", response_data)
 
         logger.info("Validating response data against expected result.")
         for key, value in expected_result.items():
-            assert key in response_data
-            assert response_data[key] == value
+            if key == "password":
+                assert key not in response_data
+            else:
+                assert response_data[key] == value
 
         user_id = expected_result["id"]
         stmt = select(UserModel).where(UserModel.id == user_id)
         result = await async_session.execute(stmt)
         updated_user = result.scalar_one_or_none()
 
-        logger.info(f"Checking if user with ID {user_id} was updated in the database.")
+        logger.info("Checking if user with ID %s was updated in the database.", user_id)
         assert updated_user is not None
         assert updated_user.name == expected_result["name"]
         assert updated_user.email == expected_result["email"]
-        assert updated_user.password == expected_result["password"]
+        assert verify_password(expected_result["password"], updated_user.password)
 
 
 @pytest.mark.asyncio
@@ -241,10 +293,10 @@ async def test_delete_user(
     :return: Функция не содержит return, поэтому по завершении возвращает None (неявно).
     """
     logger.info("Using user and JWT from get_user_and_jwt fixture.")
-    logger.info(f"Test case: user_case={user_case}")
-    logger.debug(f"Token: {token}")
-    logger.info(f"Expected status code: {expected_status_code}")
-    logger.info(f"Expected result: {expected_result}")
+    logger.info("Test case: user_case=%s", user_case)
+    logger.debug("Token: %s", token)
+    logger.info("Expected status code: %s", expected_status_code)
+    logger.info("Expected result: %s", expected_result)
 
     if user_case == 0:
         logger.debug("Using JWT token from get_user_and_jwt fixture.")
@@ -257,13 +309,13 @@ async def test_delete_user(
         "/service_user/delete_user",
         headers=headers,
     )
-    logger.info(f"Received response with status code: {response.status_code}")
+    logger.info("Received response with status code: %s", response.status_code)
 
     assert response.status_code == expected_status_code
 
     if expected_status_code == 204:
         response_text = response.text
-        logger.debug(f"Response text: {response_text}")
+        logger.debug("Response text: %s", response_text)
 
         assert response_text == expected_result
 
@@ -274,6 +326,6 @@ async def test_delete_user(
         deleted_user = result.scalar_one_or_none()
 
         logger.info(
-            f"Checking if user with ID {user_id} was deleted from the database."
+            "Checking if user with ID %s was deleted from the database.", user_id
         )
         assert deleted_user is None